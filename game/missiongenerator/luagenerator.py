@@ -35,7 +35,7 @@ def __init__(
         self.game = game
         self.mission = mission
         self.mission_data = mission_data
-        self.plugin_scripts: list[str] = []
+        self.plugin_scripts: set[str] = set()
 
     def generate(self) -> None:
         ewrj_triggers = [
@@ -276,7 +276,7 @@ def inject_lua_trigger(self, contents: str, comment: str) -> None:
         self.mission.triggerrules.triggers.append(trigger)
 
     def bypass_plugin_script(self, mnemonic: str) -> None:
-        self.plugin_scripts.append(mnemonic)
+        self.plugin_scripts.add(mnemonic)
 
     def inject_plugin_script(
         self, plugin_mnemonic: str, script: str, script_mnemonic: str
@@ -285,7 +285,7 @@ def inject_plugin_script(
             logging.debug(f"Skipping already loaded {script} for {plugin_mnemonic}")
             return
 
-        self.plugin_scripts.append(script_mnemonic)
+        self.plugin_scripts.add(script_mnemonic)
 
         plugin_path = Path("./resources/plugins", plugin_mnemonic)
 
@@ -378,14 +378,24 @@ def get_or_create_item(self, item_name: Optional[str] = None) -> LuaItem:
         """gets item from the LuaArray or creates one if it does not exist already"""
         raise NotImplementedError
 
-    @abstractmethod
-    def serialize(self) -> str:
+    def serialize_value(self) -> str:
         if isinstance(self.value, LuaValue):
             return self.value.serialize()
         else:
             serialized_data = [d.serialize() for d in self.value]
             return "{" + ", ".join(serialized_data) + "}"
 
+    @abstractmethod
+    def serialize(self, out: list[str], level: int = 0) -> None:
+        """appends the serialized fragments of the item to out"""
+        raise NotImplementedError
+
+    def to_string(self) -> str:
+        """serialize the item to a string"""
+        out: list[str] = []
+        self.serialize(out)
+        return "".join(out)
+
 
 class LuaData(LuaItem):
     objects: list[LuaData]
@@ -414,44 +424,37 @@ def get_or_create_item(self, item_name: Optional[str] = None) -> LuaItem:
                 return item
         return self.add_item(item_name)
 
-    def serialize(self, level: int = 0) -> str:
-        """serialize the LuaData to a string"""
-        serialized_data: list[str] = []
-        serialized_name = ""
-        linebreak = "\n"
-        tab = "\t"
-        tab_end = ""
-        for _ in range(level):
-            tab += "\t"
-            tab_end += "\t"
-        if self.base_name:
-            # Only used for initialization of the object in lua
-            serialized_name += self.base_name + " = "
-        if self.objects:
+    def serialize(self, out: list[str], level: int = 0) -> None:
+        """serialize the LuaData into out"""
+        # Nested tables can get deep, so walk them with an explicit stack of
+        # pending (item, level) pairs and literal closing/separator fragments.
+        pending: list[tuple[LuaData, int] | str] = [(self, level)]
+        while pending:
+            entry = pending.pop()
+            if isinstance(entry, str):
+                out.append(entry)
+                continue
+            item, item_level = entry
+            if not item.objects:
+                # key with value or only value
+                if item.name:
+                    out.append(item.name + " = ")
+                out.append(item.serialize_value())
+                continue
             # nested objects
-            serialized_objects = [o.serialize(level + 1) for o in self.objects]
-            if self.name:
-                if self.name is not self.base_name:
-                    serialized_name += self.name + " = "
-            serialized_data.append(
-                serialized_name
-                + "{"
-                + linebreak
-                + tab
-                + ("," + linebreak + tab).join(serialized_objects)
-                + linebreak
-                + tab_end
-                + "}"
-            )
-        else:
-            # key with value
-            if self.name:
-                serialized_data.append(self.name + " = " + super().serialize())
-            # only value
-            else:
-                serialized_data.append(super().serialize())
-
-        return "\n".join(serialized_data)
+            if item.base_name:
+                # Only used for initialization of the object in lua
+                out.append(item.base_name + " = ")
+            if item.name and item.name is not item.base_name:
+                out.append(item.name + " = ")
+            tab = "\t" * (item_level + 1)
+            out.append("{\n" + tab)
+            pending.append("\n" + "\t" * item_level + "}")
+            separator = ",\n" + tab
+            for lua_object in reversed(item.objects[1:]):
+                pending.append((lua_object, item_level + 1))
+                pending.append(separator)
+            pending.append((item.objects[0], item_level + 1))
 
     def create_operations_lua(self) -> str:
         """crates the liberation lua script for the dcs mission"""
@@ -460,4 +463,4 @@ def create_operations_lua(self) -> str:
 env.info("DCSRetribution|: setting configuration table")
 """
 
-        return lua_prefix + self.serialize()
+        return lua_prefix + self.to_string()
@@ -1,5 +1,6 @@
 import logging
 import random
+import re
 from typing import Any, Tuple
 
 from dcs import Mission
@@ -27,6 +28,15 @@
 from game.naming import NameGenerator
 from game.theater import Airfield, ControlPoint, Fob, NavalControlPoint
 
+# Matches everything str.isalnum() rejects. \W is the complement of
+# isalnum() plus the underscore, so the underscore is excluded explicitly.
+NON_ALNUM_RE = re.compile(r"[\W_]")
+# Matches everything that isn't alphanumeric, whitespace or a hyphen.
+NON_ZONE_NAME_RE = re.compile(r"[^\w\s-]|_")
+PRETENSE_NAME_TRANSLATION = str.maketrans(
+    {"Ä": "A", "Ö": "O", "Ø": "O", "ä": "a", "ö": "o", "ø": "o"}
+)
+
 
 class PretenseNameGenerator(NameGenerator):
     @classmethod
@@ -39,12 +49,14 @@ def next_pretense_aircraft_name(cls, cp: ControlPoint, flight: Flight) -> str:
 
     @classmethod
     def pretense_trimmed_cp_name(cls, cp_name: str) -> str:
-        cp_name_alnum = "".join([i for i in cp_name.lower() if i.isalnum()])
+        cp_name_alnum = NON_ALNUM_RE.sub("", cp_name.lower())
         cp_name_trimmed = cp_name_alnum.lstrip("1 2 3 4 5 6 7 8 9 0")
-        cp_name_trimmed = cp_name_trimmed.replace("ä", "a")
-        cp_name_trimmed = cp_name_trimmed.replace("ö", "o")
-        cp_name_trimmed = cp_name_trimmed.replace("ø", "o")
-        return cp_name_trimmed
+        return cp_name_trimmed.translate(PRETENSE_NAME_TRANSLATION)
+
+    @classmethod
+    def pretense_zone_name(cls, cp_name: str) -> str:
+        cp_name_zone = NON_ZONE_NAME_RE.sub("", cp_name)
+        return cp_name_zone.translate(PRETENSE_NAME_TRANSLATION)
 
 
 namegen = PretenseNameGenerator
@@ -3,8 +3,8 @@
 import logging
 import random
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
 from datetime import datetime
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional, List, Type
 
@@ -12,8 +12,8 @@
 from dcs.action import DoScript, DoScriptFile
 from dcs.ships import Stennis, CVN_71, CVN_72, CVN_73, CVN_75, Forrestal
 from dcs.translation import String
-from dcs.triggers import TriggerStart
-from dcs.unittype import VehicleType, ShipType
+from dcs.triggers import TriggerRule, TriggerStart
+from dcs.unittype import VehicleType, ShipType, UnitType as DcsUnitType
 from dcs.vehicles import AirDefence, Unarmed
 
 from game.ato import FlightType
@@ -34,19 +34,128 @@
 PRETENSE_RED_SIDE = 1
 PRETENSE_BLUE_SIDE = 2
 PRETENSE_NUMBER_OF_ZONES_TO_CONNECT_CARRIERS_TO = 2
-
-
-@dataclass
-class PretenseSam:
-    name: str
-    enabled: bool
-
-    def __init__(
-        self,
-        name: str,
-    ) -> None:
-        self.name = name
-        self.enabled = False
+# Supply, aircraft command and mission command upgrades of naval zones.
+PRETENSE_SEA_ZONE_UPGRADES = ("oilPump", "chemTank", "comCenter")
+
+
+PRETENSE_PLUGIN_DIR = Path("./resources/plugins/pretense")
+
+
+@cache
+def load_pretense_init_script(name: str) -> str:
+    """Returns the contents of a static Pretense init script fragment.
+
+    The fragments never change at runtime, so each is only read from disk once.
+    """
+    return (PRETENSE_PLUGIN_DIR / name).read_text()
+
+
+# Maps the launcher unit type of each SAM system to the Pretense preset that
+# represents it. A control point gets the preset if any of its ground objects
+# contain the launcher.
+PRETENSE_SAM_PRESETS: dict[Type[DcsUnitType], str] = {
+    AirDefence.S_75M_Volhov: "sa2",
+    AirDefence.x_5p73_s_125_ln: "sa3",
+    AirDefence.S_200_Launcher: "sa5",
+    AirDefence.Kub_2P25_ln: "sa6",
+    AirDefence.S_300PS_5P85C_ln: "sa10",
+    AirDefence.S_300PS_5P85D_ln: "sa10",
+    AirDefence.SA_11_Buk_LN_9A310M1: "sa11",
+    AirDefence.Hawk_ln: "hawk",
+    AirDefence.Patriot_ln: "patriot",
+    AirDefence.NASAMS_LN_B: "nasamsb",
+    AirDefence.NASAMS_LN_C: "nasamsc",
+    AirDefence.rapier_fsa_launcher: "rapier",
+    AirDefence.Roland_ADS: "roland",
+    AirDefence.HQ_7_STR_SP: "hq7",
+    IRON_DOME_LN: "irondome",
+    DAVID_SLING_LN: "davidsling",
+}
+# Order in which the SAM presets are emitted into the upgrade list.
+PRETENSE_SAM_PRESET_ORDER = [
+    "sa2",
+    "sa3",
+    "sa5",
+    "sa6",
+    "sa10",
+    "sa11",
+    "hawk",
+    "patriot",
+    "nasamsb",
+    "nasamsc",
+    "rapier",
+    "roland",
+    "hq7",
+    "irondome",
+    "davidsling",
+]
+
+# Pretense preset and parameters of the zone attack and patrol missions, keyed
+# by flight type. CAS, tanker and AEW&C flights depend on per-flight data and
+# are handled separately.
+PRETENSE_ZONE_AIR_MISSIONS: dict[FlightType, tuple[str, str]] = {
+    FlightType.SEAD: ("attack.sead", "altitude=25000, expend=AI.Task.WeaponExpend.ALL"),
+    FlightType.DEAD: ("attack.sead", "altitude=25000, expend=AI.Task.WeaponExpend.ALL"),
+    FlightType.BAI: (
+        "attack.bai",
+        "altitude=10000, expend=AI.Task.WeaponExpend.QUARTER",
+    ),
+    FlightType.STRIKE: (
+        "attack.strike",
+        "altitude=20000, expend=AI.Task.WeaponExpend.ALL",
+    ),
+    FlightType.BARCAP: ("patrol.aircraft", "altitude=25000, range=25"),
+}
+
+# Static skeletons of the Pretense zone upgrade definitions. {n} is the trimmed
+# control point name and {side} the Pretense side ("red" or "blue").
+PRETENSE_ZONE_UPGRADES_HEADER = """\
+zones.{n}:defineUpgrades({{
+    [1] = {{ --red side
+"""
+PRETENSE_ZONE_UPGRADES_SIDE_SEPARATOR = """\
+    },
+    [2] = --blue side
+    {
+"""
+PRETENSE_ZONE_UPGRADES_FOOTER = """\
+    }
+})
+"""
+PRETENSE_ZONE_LAND_INFANTRY_TEMPLATE = """\
+        presets.upgrades.basic.tent:extend({{
+            name='{n}-tent-{side}',
+            products = {{
+                presets.special.{side}.infantry:extend({{ name='{n}-defense-{side}'}})
+            }}
+        }}),
+        presets.upgrades.basic.comPost:extend({{
+            name = '{n}-com-{side}',
+            products = {{
+                presets.special.{side}.infantry:extend({{ name='{n}-defense-{side}'}}),
+                presets.defenses.{side}.infantry:extend({{ name='{n}-garrison-{side}' }})
+            }}
+        }}),
+"""
+PRETENSE_ZONE_LAND_ARTILLERY_TEMPLATE = """\
+        presets.upgrades.basic.tent:extend({{
+            name='{n}-tent-{side}',
+            products = {{
+            }}
+        }}),
+        presets.upgrades.basic.comPost:extend({{
+            name = '{n}-com-{side}',
+            products = {{
+                presets.special.{side}.infantry:extend({{ name='{n}-defense-{side}'}}),
+            }}
+        }}),
+        presets.upgrades.basic.artyBunker:extend({{
+            name='{n}-arty-{side}',
+            products = {{
+                presets.defenses.{side}.artillery:extend({{ name='{n}-artillery-{side}'}})
+            }}
+        }}),
+"""
 
 
 class PretenseLuaGenerator(LuaGenerator):
@@ -65,18 +174,22 @@ def __init__(
         self.game = game
         self.mission = mission
         self.mission_data = mission_data
-        self.plugin_scripts: list[str] = []
+        self.plugin_scripts: set[str] = set()
 
     def generate(self) -> None:
-        ewrj_triggers = [
-            x for x in self.mission.triggerrules.triggers if isinstance(x, TriggerStart)
+        triggers = self.mission.triggerrules.triggers
+        ewrj_triggers: list[TriggerRule] = [
+            x for x in triggers if isinstance(x, TriggerStart)
         ]
         self.generate_pretense_plugin_data()
         self.generate_plugin_data()
         self.inject_plugins()
-        for t in ewrj_triggers:
-            self.mission.triggerrules.triggers.remove(t)
-            self.mission.triggerrules.triggers.append(t)
+        # Move the pre-existing start triggers behind the Pretense ones in a single
+        # stable partition rather than removing them one at a time.
+        ewrj_trigger_ids = {id(t) for t in ewrj_triggers}
+        triggers[:] = [
+            t for t in triggers if id(t) not in ewrj_trigger_ids
+        ] + ewrj_triggers
 
     def generate_plugin_data(self) -> None:
         super().generate_plugin_data()
@@ -99,43 +212,11 @@ def generate_sam_from_preset(
         )
         return lua_string_zones
 
-    def generate_pretense_land_upgrade_supply(self, cp_name: str, cp_side: int) -> str:
+    def generate_pretense_ground_missions(
+        self, cp_side: int, cp_name_trimmed: str
+    ) -> str:
+        """Ground convoy and ground assault missions of a zone."""
         lua_string_zones = ""
-        cp_name_trimmed = PretenseNameGenerator.pretense_trimmed_cp_name(cp_name)
-        cp_side_str = "blue" if cp_side == PRETENSE_BLUE_SIDE else "red"
-        cp = self.game.theater.controlpoints[0]
-        for loop_cp in self.game.theater.controlpoints:
-            if loop_cp.name == cp_name:
-                cp = loop_cp
-        sam_presets: dict[str, PretenseSam] = {}
-        for sam_name in [
-            "sa2",
-            "sa3",
-            "sa5",
-            "sa6",
-            "sa10",
-            "sa11",
-            "hawk",
-            "patriot",
-            "nasamsb",
-            "nasamsc",
-            "rapier",
-            "roland",
-            "hq7",
-            "irondome",
-            "davidsling",
-        ]:
-            sam_presets[sam_name] = PretenseSam(sam_name)
-
-        lua_string_zones += "        presets.upgrades.supply.fuelTank:extend({\n"
-        lua_string_zones += (
-            "            name = '"
-            + cp_name_trimmed
-            + "-fueltank-"
-            + cp_side_str
-            + "',\n"
-        )
-        lua_string_zones += "            products = {\n"
         for ground_group in self.game.pretense_ground_supply[cp_side][cp_name_trimmed]:
             lua_string_zones += (
                 "                presets.missions.supply.convoy:extend({ name='"
@@ -148,132 +229,41 @@ def generate_pretense_land_upgrade_supply(self, cp_name: str, cp_side: int) -> s
                 + ground_group
                 + "'}),\n"
             )
-        for mission_type in self.game.pretense_air[cp_side][cp_name_trimmed]:
-            if mission_type == FlightType.AIR_ASSAULT:
-                mission_name = "supply.helo"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
-                    lua_string_zones += (
-                        f"                presets.missions.{mission_name}:extend"
-                        + "({name='"
-                        + air_group
-                        + "'}),\n"
-                    )
-        lua_string_zones += "            }\n"
-        lua_string_zones += "        }),\n"
-        lua_string_zones += "        presets.upgrades.airdef.bunker:extend({\n"
-        lua_string_zones += (
-            f"            name = '{cp_name_trimmed}-shorad-command-"
-            + cp_side_str
-            + "',\n"
-        )
-        lua_string_zones += "            products = {\n"
-        lua_string_zones += (
-            "                presets.defenses."
-            + cp_side_str
-            + ".shorad:extend({ name='"
-            + cp_name_trimmed
-            + "-shorad-"
-            + cp_side_str
-            + "' }),\n"
-        )
-        lua_string_zones += "            }\n"
-        lua_string_zones += "        }),\n"
+        return lua_string_zones
 
-        for ground_object in cp.ground_objects:
-            for ground_unit in ground_object.units:
-                if ground_unit.unit_type is not None:
-                    if ground_unit.unit_type.dcs_unit_type == AirDefence.S_75M_Volhov:
-                        sam_presets["sa2"].enabled = True
-                    if (
-                        ground_unit.unit_type.dcs_unit_type
-                        == AirDefence.x_5p73_s_125_ln
-                    ):
-                        sam_presets["sa3"].enabled = True
-                    if ground_unit.unit_type.dcs_unit_type == AirDefence.S_200_Launcher:
-                        sam_presets["sa5"].enabled = True
-                    if ground_unit.unit_type.dcs_unit_type == AirDefence.Kub_2P25_ln:
-                        sam_presets["sa6"].enabled = True
-                    if (
-                        ground_unit.unit_type.dcs_unit_type
-                        == AirDefence.S_300PS_5P85C_ln
-                        or ground_unit.unit_type.dcs_unit_type
-                        == AirDefence.S_300PS_5P85D_ln
-                    ):
-                        sam_presets["sa10"].enabled = True
-                    if (
-                        ground_unit.unit_type.dcs_unit_type
-                        == AirDefence.SA_11_Buk_LN_9A310M1
-                    ):
-                        sam_presets["sa11"].enabled = True
-                    if ground_unit.unit_type.dcs_unit_type == AirDefence.Hawk_ln:
-                        sam_presets["hawk"].enabled = True
-                    if ground_unit.unit_type.dcs_unit_type == AirDefence.Patriot_ln:
-                        sam_presets["patriot"].enabled = True
-                    if ground_unit.unit_type.dcs_unit_type == AirDefence.NASAMS_LN_B:
-                        sam_presets["nasamsb"].enabled = True
-                    if ground_unit.unit_type.dcs_unit_type == AirDefence.NASAMS_LN_C:
-                        sam_presets["nasamsc"].enabled = True
-                    if (
-                        ground_unit.unit_type.dcs_unit_type
-                        == AirDefence.rapier_fsa_launcher
-                    ):
-                        sam_presets["rapier"].enabled = True
-                    if ground_unit.unit_type.dcs_unit_type == AirDefence.Roland_ADS:
-                        sam_presets["roland"].enabled = True
-                    if ground_unit.unit_type.dcs_unit_type == AirDefence.HQ_7_STR_SP:
-                        sam_presets["hq7"].enabled = True
-                    if ground_unit.unit_type.dcs_unit_type == IRON_DOME_LN:
-                        sam_presets["irondome"].enabled = True
-                    if ground_unit.unit_type.dcs_unit_type == DAVID_SLING_LN:
-                        sam_presets["davidsling"].enabled = True
-
-        cp_has_sams = False
-        for sam_name in sam_presets:
-            if sam_presets[sam_name].enabled:
-                cp_has_sams = True
-                break
-        if cp_has_sams:
-            lua_string_zones += "        presets.upgrades.airdef.comCenter:extend({\n"
-            lua_string_zones += (
-                f"            name = '{cp_name_trimmed}-sam-command-"
-                + cp_side_str
-                + "',\n"
-            )
-            lua_string_zones += "            products = {\n"
-            for sam_name in sam_presets:
-                if sam_presets[sam_name].enabled:
-                    lua_string_zones += self.generate_sam_from_preset(
-                        sam_name, cp_side_str, cp_name_trimmed
-                    )
-            lua_string_zones += "            }\n"
-            lua_string_zones += "        }),\n"
+    def generate_pretense_air_missions(
+        self, cp_side: int, cp_name_trimmed: str, include_dead: bool
+    ) -> tuple[str, str]:
+        """Air missions of a zone, classified in a single pass.
 
-        lua_string_zones += "        presets.upgrades.supply.hangar:extend({\n"
-        lua_string_zones += (
-            f"            name = '{cp_name_trimmed}-aircraft-command-"
-            + cp_side_str
-            + "',\n"
-        )
-        lua_string_zones += "            products = {\n"
-        for mission_type in self.game.pretense_air[cp_side][cp_name_trimmed]:
-            if mission_type in (FlightType.SEAD, FlightType.DEAD):
-                mission_name = "attack.sead"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
+        Returns the helo supply missions, which belong to the zone's supply
+        upgrade, and the attack, patrol and support missions, which belong to
+        its aircraft command upgrade.
+        """
+        lua_string_helo = ""
+        lua_string_zones = ""
+        air_missions = self.game.pretense_air[cp_side][cp_name_trimmed]
+        for mission_type, air_groups in air_missions.items():
+            if mission_type == FlightType.AIR_ASSAULT:
+                for air_group in air_groups:
+                    lua_string_helo += (
+                        "                presets.missions.supply.helo:extend"
+                        f"({{name='{air_group}'}}),\n"
+                    )
+                continue
+            if mission_type == FlightType.DEAD and not include_dead:
+                continue
+            mission_preset = PRETENSE_ZONE_AIR_MISSIONS.get(mission_type)
+            if mission_preset is not None:
+                mission_name, mission_params = mission_preset
+                for air_group in air_groups:
                     lua_string_zones += (
                         f"                presets.missions.{mission_name}:extend"
-                        + "({name='"
-                        + air_group
-                        + "', altitude=25000, expend=AI.Task.WeaponExpend.ALL}),\n"
+                        f"({{name='{air_group}', {mission_params}}}),\n"
                     )
             elif mission_type == FlightType.CAS:
                 mission_name = "attack.cas"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
+                for air_group in air_groups:
                     flight = self.game.pretense_air_groups[air_group]
                     if flight.is_helo:
                         mission_name = "attack.helo"
@@ -283,44 +273,9 @@ def generate_pretense_land_upgrade_supply(self, cp_name: str, cp_side: int) -> s
                         + air_group
                         + "', altitude=15000, expend=AI.Task.WeaponExpend.QUARTER}),\n"
                     )
-            elif mission_type == FlightType.BAI:
-                mission_name = "attack.bai"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
-                    lua_string_zones += (
-                        f"                presets.missions.{mission_name}:extend"
-                        + "({name='"
-                        + air_group
-                        + "', altitude=10000, expend=AI.Task.WeaponExpend.QUARTER}),\n"
-                    )
-            elif mission_type == FlightType.STRIKE:
-                mission_name = "attack.strike"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
-                    lua_string_zones += (
-                        f"                presets.missions.{mission_name}:extend"
-                        + "({name='"
-                        + air_group
-                        + "', altitude=20000, expend=AI.Task.WeaponExpend.ALL}),\n"
-                    )
-            elif mission_type == FlightType.BARCAP:
-                mission_name = "patrol.aircraft"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
-                    lua_string_zones += (
-                        f"                presets.missions.{mission_name}:extend"
-                        + "({name='"
-                        + air_group
-                        + "', altitude=25000, range=25}),\n"
-                    )
             elif mission_type == FlightType.REFUELING:
                 mission_name = "support.tanker"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
+                for air_group in air_groups:
                     tanker_freq = 257.0
                     tanker_tacan = 37.0
                     tanker_variant = "Drogue"
@@ -344,9 +299,7 @@ def generate_pretense_land_upgrade_supply(self, cp_name: str, cp_side: int) -> s
                     )
             elif mission_type == FlightType.AEWC:
                 mission_name = "support.awacs"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
+                for air_group in air_groups:
                     awacs_freq = 257.5
                     for awacs in self.mission_data.awacs:
                         if awacs.group_name == air_group:
@@ -359,62 +312,40 @@ def generate_pretense_land_upgrade_supply(self, cp_name: str, cp_side: int) -> s
                         + str(awacs_freq)
                         + "}),\n"
                     )
-        lua_string_zones += "            }\n"
-        lua_string_zones += "        })\n"
+        return lua_string_helo, lua_string_zones
 
-        return lua_string_zones
-
-    def generate_pretense_sea_upgrade_supply(self, cp_name: str, cp_side: int) -> str:
+    def generate_pretense_land_upgrade_supply(self, cp_name: str, cp_side: int) -> str:
         lua_string_zones = ""
         cp_name_trimmed = PretenseNameGenerator.pretense_trimmed_cp_name(cp_name)
         cp_side_str = "blue" if cp_side == PRETENSE_BLUE_SIDE else "red"
-
-        supply_ship = "oilPump"
-        tanker_ship = "chemTank"
-        command_ship = "comCenter"
-
-        lua_string_zones += (
-            "        presets.upgrades.supply." + supply_ship + ":extend({\n"
+        lua_string_helo_missions, lua_string_air_missions = (
+            self.generate_pretense_air_missions(
+                cp_side, cp_name_trimmed, include_dead=True
+            )
         )
+        cp = self.game.theater.controlpoints[0]
+        for loop_cp in self.game.theater.controlpoints:
+            if loop_cp.name == cp_name:
+                cp = loop_cp
+
+        lua_string_zones += "        presets.upgrades.supply.fuelTank:extend({\n"
         lua_string_zones += (
             "            name = '"
             + cp_name_trimmed
-            + f"-{supply_ship}-"
+            + "-fueltank-"
             + cp_side_str
             + "',\n"
         )
         lua_string_zones += "            products = {\n"
-        for ground_group in self.game.pretense_ground_supply[cp_side][cp_name_trimmed]:
-            lua_string_zones += (
-                "                presets.missions.supply.convoy:extend({ name='"
-                + ground_group
-                + "'}),\n"
-            )
-        for ground_group in self.game.pretense_ground_assault[cp_side][cp_name_trimmed]:
-            lua_string_zones += (
-                "                presets.missions.attack.surface:extend({ name='"
-                + ground_group
-                + "'}),\n"
-            )
-        for mission_type in self.game.pretense_air[cp_side][cp_name_trimmed]:
-            if mission_type == FlightType.AIR_ASSAULT:
-                mission_name = "supply.helo"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
-                    lua_string_zones += (
-                        f"                presets.missions.{mission_name}:extend"
-                        + "({name='"
-                        + air_group
-                        + "'}),\n"
-                    )
+        lua_string_zones += self.generate_pretense_ground_missions(
+            cp_side, cp_name_trimmed
+        )
+        lua_string_zones += lua_string_helo_missions
         lua_string_zones += "            }\n"
         lua_string_zones += "        }),\n"
+        lua_string_zones += "        presets.upgrades.airdef.bunker:extend({\n"
         lua_string_zones += (
-            "        presets.upgrades.airdef." + command_ship + ":extend({\n"
-        )
-        lua_string_zones += (
-            f"            name = '{cp_name_trimmed}-mission-command-"
+            f"            name = '{cp_name_trimmed}-shorad-command-"
             + cp_side_str
             + "',\n"
         )
@@ -430,248 +361,138 @@ def generate_pretense_sea_upgrade_supply(self, cp_name: str, cp_side: int) -> st
         )
         lua_string_zones += "            }\n"
         lua_string_zones += "        }),\n"
-        lua_string_zones += (
-            "        presets.upgrades.attack." + tanker_ship + ":extend({\n"
-        )
+
+        enabled_sams: set[str] = set()
+        for ground_object in cp.ground_objects:
+            for ground_unit in ground_object.units:
+                if ground_unit.unit_type is None:
+                    continue
+                sam_name = PRETENSE_SAM_PRESETS.get(ground_unit.unit_type.dcs_unit_type)
+                if sam_name is not None:
+                    enabled_sams.add(sam_name)
+
+        if enabled_sams:
+            lua_string_zones += "        presets.upgrades.airdef.comCenter:extend({\n"
+            lua_string_zones += (
+                f"            name = '{cp_name_trimmed}-sam-command-"
+                + cp_side_str
+                + "',\n"
+            )
+            lua_string_zones += "            products = {\n"
+            for sam_name in PRETENSE_SAM_PRESET_ORDER:
+                if sam_name in enabled_sams:
+                    lua_string_zones += self.generate_sam_from_preset(
+                        sam_name, cp_side_str, cp_name_trimmed
+                    )
+            lua_string_zones += "            }\n"
+            lua_string_zones += "        }),\n"
+
+        lua_string_zones += "        presets.upgrades.supply.hangar:extend({\n"
         lua_string_zones += (
             f"            name = '{cp_name_trimmed}-aircraft-command-"
             + cp_side_str
             + "',\n"
         )
         lua_string_zones += "            products = {\n"
-        for mission_type in self.game.pretense_air[cp_side][cp_name_trimmed]:
-            if mission_type == FlightType.SEAD:
-                mission_name = "attack.sead"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
-                    lua_string_zones += (
-                        f"                presets.missions.{mission_name}:extend"
-                        + "({name='"
-                        + air_group
-                        + "', altitude=25000, expend=AI.Task.WeaponExpend.ALL}),\n"
-                    )
-            elif mission_type == FlightType.CAS:
-                mission_name = "attack.cas"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
-                    flight = self.game.pretense_air_groups[air_group]
-                    if flight.is_helo:
-                        mission_name = "attack.helo"
-                    lua_string_zones += (
-                        f"                presets.missions.{mission_name}:extend"
-                        + "({name='"
-                        + air_group
-                        + "', altitude=15000, expend=AI.Task.WeaponExpend.QUARTER}),\n"
-                    )
-            elif mission_type == FlightType.BAI:
-                mission_name = "attack.bai"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
-                    lua_string_zones += (
-                        f"                presets.missions.{mission_name}:extend"
-                        + "({name='"
-                        + air_group
-                        + "', altitude=10000, expend=AI.Task.WeaponExpend.QUARTER}),\n"
-                    )
-            elif mission_type == FlightType.STRIKE:
-                mission_name = "attack.strike"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
-                    lua_string_zones += (
-                        f"                presets.missions.{mission_name}:extend"
-                        + "({name='"
-                        + air_group
-                        + "', altitude=20000, expend=AI.Task.WeaponExpend.ALL}),\n"
-                    )
-            elif mission_type == FlightType.BARCAP:
-                mission_name = "patrol.aircraft"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
-                    lua_string_zones += (
-                        f"                presets.missions.{mission_name}:extend"
-                        + "({name='"
-                        + air_group
-                        + "', altitude=25000, range=25}),\n"
-                    )
-            elif mission_type == FlightType.REFUELING:
-                mission_name = "support.tanker"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
-                    tanker_freq = 257.0
-                    tanker_tacan = 37.0
-                    tanker_variant = "Drogue"
-                    for tanker in self.mission_data.tankers:
-                        if tanker.group_name == air_group:
-                            tanker_freq = tanker.freq.hertz / 1000000
-                            tanker_tacan = tanker.tacan.number if tanker.tacan else 0.0
-                            if tanker.variant == "KC-135 Stratotanker":
-                                tanker_variant = "Boom"
-                    lua_string_zones += (
-                        f"                presets.missions.{mission_name}:extend"
-                        + "({name='"
-                        + air_group
-                        + "', freq='"
-                        + str(tanker_freq)
-                        + "', tacan='"
-                        + str(tanker_tacan)
-                        + "', variant='"
-                        + tanker_variant
-                        + "'}),\n"
-                    )
-            elif mission_type == FlightType.AEWC:
-                mission_name = "support.awacs"
-                for air_group in self.game.pretense_air[cp_side][cp_name_trimmed][
-                    mission_type
-                ]:
-                    awacs_freq = 257.5
-                    for awacs in self.mission_data.awacs:
-                        if awacs.group_name == air_group:
-                            awacs_freq = awacs.freq.hertz / 1000000
-                    lua_string_zones += (
-                        f"                presets.missions.{mission_name}:extend"
-                        + "({name='"
-                        + air_group
-                        + "', freq="
-                        + str(awacs_freq)
-                        + "}),\n"
-                    )
+        lua_string_zones += lua_string_air_missions
         lua_string_zones += "            }\n"
         lua_string_zones += "        })\n"
 
         return lua_string_zones
 
-    def generate_pretense_zone_land(self, cp_name: str) -> str:
-        is_artillery_zone = random.choice([True, False])
-
+    def generate_pretense_sea_upgrade_supply(self, cp_name: str, cp_side: int) -> str:
         lua_string_zones = ""
         cp_name_trimmed = PretenseNameGenerator.pretense_trimmed_cp_name(cp_name)
-
-        lua_string_zones += f"zones.{cp_name_trimmed}:defineUpgrades(" + "{\n"
-        lua_string_zones += "    [1] = { --red side\n"
-        lua_string_zones += "        presets.upgrades.basic.tent:extend({\n"
-        lua_string_zones += f"            name='{cp_name_trimmed}-tent-red',\n"
-        lua_string_zones += "            products = {\n"
-        if not is_artillery_zone:
-            lua_string_zones += (
-                "                presets.special.red.infantry:extend({ name='"
-                + cp_name_trimmed
-                + "-defense-red'})\n"
+        cp_side_str = "blue" if cp_side == PRETENSE_BLUE_SIDE else "red"
+        lua_string_helo_missions, lua_string_air_missions = (
+            self.generate_pretense_air_missions(
+                cp_side, cp_name_trimmed, include_dead=False
             )
-        lua_string_zones += "            }\n"
-        lua_string_zones += "        }),\n"
-        lua_string_zones += "        presets.upgrades.basic.comPost:extend({\n"
-        lua_string_zones += f"            name = '{cp_name_trimmed}-com-red',\n"
-        lua_string_zones += "            products = {\n"
-        lua_string_zones += (
-            "                presets.special.red.infantry:extend({ name='"
-            + cp_name_trimmed
-            + "-defense-red'}),\n"
         )
-        if not is_artillery_zone:
-            lua_string_zones += (
-                "                presets.defenses.red.infantry:extend({ name='"
-                + cp_name_trimmed
-                + "-garrison-red' })\n"
-            )
-        lua_string_zones += "            }\n"
-        lua_string_zones += "        }),\n"
-        if is_artillery_zone:
-            lua_string_zones += "        presets.upgrades.basic.artyBunker:extend({\n"
-            lua_string_zones += f"            name='{cp_name_trimmed}-arty-red',\n"
-            lua_string_zones += "            products = {\n"
-            lua_string_zones += (
-                "                presets.defenses.red.artillery:extend({ name='"
-                + cp_name_trimmed
-                + "-artillery-red'})\n"
-            )
-            lua_string_zones += "            }\n"
-            lua_string_zones += "        }),\n"
+        supply_ship, tanker_ship, command_ship = PRETENSE_SEA_ZONE_UPGRADES
 
-        lua_string_zones += self.generate_pretense_land_upgrade_supply(
-            cp_name, PRETENSE_RED_SIDE
+        lua_string_zones += (
+            "        presets.upgrades.supply." + supply_ship + ":extend({\n"
+        )
+        lua_string_zones += (
+            "            name = '"
+            + cp_name_trimmed
+            + f"-{supply_ship}-"
+            + cp_side_str
+            + "',\n"
         )
-
-        lua_string_zones += "    },\n"
-        lua_string_zones += "    [2] = --blue side\n"
-        lua_string_zones += "    {\n"
-        lua_string_zones += "        presets.upgrades.basic.tent:extend({\n"
-        lua_string_zones += f"            name='{cp_name_trimmed}-tent-blue',\n"
         lua_string_zones += "            products = {\n"
-        if not is_artillery_zone:
-            lua_string_zones += (
-                "                presets.special.blue.infantry:extend({ name='"
-                + cp_name_trimmed
-                + "-defense-blue'})\n"
-            )
+        lua_string_zones += self.generate_pretense_ground_missions(
+            cp_side, cp_name_trimmed
+        )
+        lua_string_zones += lua_string_helo_missions
         lua_string_zones += "            }\n"
         lua_string_zones += "        }),\n"
-        lua_string_zones += "        presets.upgrades.basic.comPost:extend({\n"
-        lua_string_zones += f"            name = '{cp_name_trimmed}-com-blue',\n"
+        lua_string_zones += (
+            "        presets.upgrades.airdef." + command_ship + ":extend({\n"
+        )
+        lua_string_zones += (
+            f"            name = '{cp_name_trimmed}-mission-command-"
+            + cp_side_str
+            + "',\n"
+        )
         lua_string_zones += "            products = {\n"
         lua_string_zones += (
-            "                presets.special.blue.infantry:extend({ name='"
+            "                presets.defenses."
+            + cp_side_str
+            + ".shorad:extend({ name='"
             + cp_name_trimmed
-            + "-defense-blue'}),\n"
+            + "-shorad-"
+            + cp_side_str
+            + "' }),\n"
         )
-        if not is_artillery_zone:
-            lua_string_zones += (
-                "                presets.defenses.blue.infantry:extend({ name='"
-                + cp_name_trimmed
-                + "-garrison-blue' })\n"
-            )
         lua_string_zones += "            }\n"
         lua_string_zones += "        }),\n"
-        if is_artillery_zone:
-            lua_string_zones += "        presets.upgrades.basic.artyBunker:extend({\n"
-            lua_string_zones += f"            name='{cp_name_trimmed}-arty-blue',\n"
-            lua_string_zones += "            products = {\n"
-            lua_string_zones += (
-                "                presets.defenses.blue.artillery:extend({ name='"
-                + cp_name_trimmed
-                + "-artillery-blue'})\n"
-            )
-            lua_string_zones += "            }\n"
-            lua_string_zones += "        }),\n"
-
-        lua_string_zones += self.generate_pretense_land_upgrade_supply(
-            cp_name, PRETENSE_BLUE_SIDE
+        lua_string_zones += (
+            "        presets.upgrades.attack." + tanker_ship + ":extend({\n"
         )
-
-        lua_string_zones += "    }\n"
-        lua_string_zones += "})\n"
+        lua_string_zones += (
+            f"            name = '{cp_name_trimmed}-aircraft-command-"
+            + cp_side_str
+            + "',\n"
+        )
+        lua_string_zones += "            products = {\n"
+        lua_string_zones += lua_string_air_missions
+        lua_string_zones += "            }\n"
+        lua_string_zones += "        })\n"
 
         return lua_string_zones
 
-    def generate_pretense_zone_sea(self, cp_name: str) -> str:
-        lua_string_zones = ""
+    def generate_pretense_zone_land(self, cp_name: str) -> str:
+        is_artillery_zone = random.random() < 0.5
+        zone_template = (
+            PRETENSE_ZONE_LAND_ARTILLERY_TEMPLATE
+            if is_artillery_zone
+            else PRETENSE_ZONE_LAND_INFANTRY_TEMPLATE
+        )
         cp_name_trimmed = PretenseNameGenerator.pretense_trimmed_cp_name(cp_name)
 
-        lua_string_zones += f"zones.{cp_name_trimmed}:defineUpgrades(" + "{\n"
-        lua_string_zones += "    [1] = { --red side\n"
-
-        lua_string_zones += self.generate_pretense_sea_upgrade_supply(
-            cp_name, PRETENSE_RED_SIDE
+        return (
+            PRETENSE_ZONE_UPGRADES_HEADER.format(n=cp_name_trimmed)
+            + zone_template.format(n=cp_name_trimmed, side="red")
+            + self.generate_pretense_land_upgrade_supply(cp_name, PRETENSE_RED_SIDE)
+            + PRETENSE_ZONE_UPGRADES_SIDE_SEPARATOR
+            + zone_template.format(n=cp_name_trimmed, side="blue")
+            + self.generate_pretense_land_upgrade_supply(cp_name, PRETENSE_BLUE_SIDE)
+            + PRETENSE_ZONE_UPGRADES_FOOTER
         )
 
-        lua_string_zones += "    },\n"
-        lua_string_zones += "    [2] = --blue side\n"
-        lua_string_zones += "    {\n"
+    def generate_pretense_zone_sea(self, cp_name: str) -> str:
+        cp_name_trimmed = PretenseNameGenerator.pretense_trimmed_cp_name(cp_name)
 
-        lua_string_zones += self.generate_pretense_sea_upgrade_supply(
-            cp_name, PRETENSE_BLUE_SIDE
+        return (
+            PRETENSE_ZONE_UPGRADES_HEADER.format(n=cp_name_trimmed)
+            + self.generate_pretense_sea_upgrade_supply(cp_name, PRETENSE_RED_SIDE)
+            + PRETENSE_ZONE_UPGRADES_SIDE_SEPARATOR
+            + self.generate_pretense_sea_upgrade_supply(cp_name, PRETENSE_BLUE_SIDE)
+            + PRETENSE_ZONE_UPGRADES_FOOTER
         )
 
-        lua_string_zones += "    }\n"
-        lua_string_zones += "})\n"
-
-        return lua_string_zones
-
     def generate_pretense_carrier_zones(self) -> str:
         lua_string_carrier_zones = "cmap1 = CarrierMap:new({"
         for zone_name in self.game.pretense_carrier_zones:
@@ -1398,51 +1219,34 @@ def generate_pretense_ground_groups(self, side: int) -> str:
 
     @staticmethod
     def generate_pretense_zone_connection(
-        connected_points: dict[str, list[str]],
+        connected_points: dict[str, set[str]],
         cp_name: str,
         other_cp_name: str,
     ) -> str:
         lua_string_connman = ""
-        try:
-            connected_points[cp_name]
-        except KeyError:
-            connected_points[cp_name] = list()
-        try:
-            connected_points[other_cp_name]
-        except KeyError:
-            connected_points[other_cp_name] = list()
-
-        if (
-            other_cp_name not in connected_points[cp_name]
-            and cp_name not in connected_points[other_cp_name]
-        ):
-            cp_name_conn = "".join(
-                [i for i in cp_name if i.isalnum() or i.isspace() or i == "-"]
-            )
-            cp_name_conn_other = "".join(
-                [i for i in other_cp_name if i.isalnum() or i.isspace() or i == "-"]
-            )
-            cp_name_conn = cp_name_conn.replace("Ä", "A")
-            cp_name_conn = cp_name_conn.replace("Ö", "O")
-            cp_name_conn = cp_name_conn.replace("Ø", "O")
-            cp_name_conn = cp_name_conn.replace("ä", "a")
-            cp_name_conn = cp_name_conn.replace("ö", "o")
-            cp_name_conn = cp_name_conn.replace("ø", "o")
-
-            cp_name_conn_other = cp_name_conn_other.replace("Ä", "A")
-            cp_name_conn_other = cp_name_conn_other.replace("Ö", "O")
-            cp_name_conn_other = cp_name_conn_other.replace("Ø", "O")
-            cp_name_conn_other = cp_name_conn_other.replace("ä", "a")
-            cp_name_conn_other = cp_name_conn_other.replace("ö", "o")
-            cp_name_conn_other = cp_name_conn_other.replace("ø", "o")
+        cp_connections = connected_points.setdefault(cp_name, set())
+        other_cp_connections = connected_points.setdefault(other_cp_name, set())
+
+        # Connections are always recorded on both ends, so checking one side is
+        # enough.
+        if other_cp_name not in cp_connections:
+            cp_name_conn = PretenseNameGenerator.pretense_zone_name(cp_name)
+            cp_name_conn_other = PretenseNameGenerator.pretense_zone_name(other_cp_name)
             lua_string_connman = (
                 f"    cm: addConnection('{cp_name_conn}', '{cp_name_conn_other}')\n"
             )
-            connected_points[cp_name].append(other_cp_name)
-            connected_points[other_cp_name].append(cp_name)
+            cp_connections.add(other_cp_name)
+            other_cp_connections.add(cp_name)
 
         return lua_string_connman
 
+    def init_pretense_zone(self, cp_name_trimmed: str) -> None:
+        """Ensures both sides have (possibly empty) groups registered for the zone."""
+        for side in (PRETENSE_RED_SIDE, PRETENSE_BLUE_SIDE):
+            self.game.pretense_air[side].setdefault(cp_name_trimmed, {})
+            self.game.pretense_ground_supply[side].setdefault(cp_name_trimmed, [])
+            self.game.pretense_ground_assault[side].setdefault(cp_name_trimmed, [])
+
     def generate_pretense_plugin_data(self) -> None:
         self.inject_plugin_script("base", "mist_4_5_126.lua", "mist_4_5_126")
 
@@ -1469,8 +1273,7 @@ def generate_pretense_plugin_data(self) -> None:
             f"local savefile = 'pretense_retribution_{date_time}.json'"
         )
 
-        init_header_file = open("./resources/plugins/pretense/init_header.lua", "r")
-        init_header = init_header_file.read()
+        init_header = load_pretense_init_script("init_header.lua")
 
         lua_string_ground_groups_blue = self.generate_pretense_ground_groups(
             PRETENSE_BLUE_SIDE
@@ -1479,22 +1282,19 @@ def generate_pretense_plugin_data(self) -> None:
             PRETENSE_RED_SIDE
         )
 
-        lua_string_zones = ""
+        trimmed_cp_names = {
+            cp: PretenseNameGenerator.pretense_trimmed_cp_name(cp.name)
+            for cp in self.game.theater.controlpoints
+        }
+
+        lua_zones: list[str] = []
         lua_string_carriers = ""
         if self.game.settings.pretense_controllable_carrier:
             lua_string_carriers += self.generate_pretense_carrier_zones()
 
         for cp in self.game.theater.controlpoints:
-            cp_name_trimmed = PretenseNameGenerator.pretense_trimmed_cp_name(cp.name)
-            cp_name = "".join(
-                [i for i in cp.name if i.isalnum() or i.isspace() or i == "-"]
-            )
-            cp_name.replace("Ä", "A")
-            cp_name.replace("Ö", "O")
-            cp_name.replace("Ø", "O")
-            cp_name.replace("ä", "a")
-            cp_name.replace("ö", "o")
-            cp_name.replace("ø", "o")
+            cp_name_trimmed = trimmed_cp_names[cp]
+            cp_name = PretenseNameGenerator.pretense_zone_name(cp.name)
             cp_side = 2 if cp.captured else 1
 
             if isinstance(cp, OffMapSpawn):
@@ -1512,28 +1312,7 @@ def generate_pretense_plugin_data(self) -> None:
                 )
                 continue
 
-            for side in range(1, 3):
-                if cp_name_trimmed not in self.game.pretense_air[cp_side]:
-                    self.game.pretense_air[side][cp_name_trimmed] = {}
-                if cp_name_trimmed not in self.game.pretense_ground_supply[cp_side]:
-                    self.game.pretense_ground_supply[side][cp_name_trimmed] = list()
-                if cp_name_trimmed not in self.game.pretense_ground_assault[cp_side]:
-                    self.game.pretense_ground_assault[side][cp_name_trimmed] = list()
-            cp_name = cp_name.replace("Ä", "A")
-            cp_name = cp_name.replace("Ö", "O")
-            cp_name = cp_name.replace("Ø", "O")
-            cp_name = cp_name.replace("ä", "a")
-            cp_name = cp_name.replace("ö", "o")
-            cp_name = cp_name.replace("ø", "o")
-            lua_string_zones += (
-                f"zones.{cp_name_trimmed} = ZoneCommand:new('{cp_name}')\n"
-            )
-            lua_string_zones += (
-                f"zones.{cp_name_trimmed}.initialState = "
-                + "{ side="
-                + str(cp_side)
-                + " }\n"
-            )
+            self.init_pretense_zone(cp_name_trimmed)
             max_resource = 20000
             is_helo_spawn = "false"
             is_plane_spawn = "false"
@@ -1555,92 +1334,76 @@ def generate_pretense_plugin_data(self) -> None:
                 is_plane_spawn = "true"
                 is_keep_active = "true"
                 max_resource = 50000
-            lua_string_zones += (
+            lua_zones.append(
+                f"zones.{cp_name_trimmed} = ZoneCommand:new('{cp_name}')\n"
+                f"zones.{cp_name_trimmed}.initialState = {{ side={cp_side} }}\n"
                 f"zones.{cp_name_trimmed}.maxResource = {max_resource}\n"
-            )
-            lua_string_zones += (
-                f"zones.{cp_name_trimmed}.isHeloSpawn = " + is_helo_spawn + "\n"
-            )
-            lua_string_zones += (
-                f"zones.{cp_name_trimmed}.isPlaneSpawn = " + is_plane_spawn + "\n"
-            )
-            lua_string_zones += (
-                f"zones.{cp_name_trimmed}.keepActive = " + is_keep_active + "\n"
+                f"zones.{cp_name_trimmed}.isHeloSpawn = {is_helo_spawn}\n"
+                f"zones.{cp_name_trimmed}.isPlaneSpawn = {is_plane_spawn}\n"
+                f"zones.{cp_name_trimmed}.keepActive = {is_keep_active}\n"
             )
             if cp.is_fleet:
-                lua_string_zones += self.generate_pretense_zone_sea(cp_name)
+                lua_zones.append(self.generate_pretense_zone_sea(cp_name))
             else:
-                lua_string_zones += self.generate_pretense_zone_land(cp_name)
-
-        lua_string_connman = "	cm = ConnectionManager:new()\n"
+                lua_zones.append(self.generate_pretense_zone_land(cp_name))
+        lua_connman = ["	cm = ConnectionManager:new()\n"]
 
         # Generate ConnectionManager connections
-        connected_points: dict[str, list[str]] = {}
+        connected_points: dict[str, set[str]] = {}
+        closest_friendly_cps = self.game.theater.closest_friendly_control_points()
         for cp in self.game.theater.controlpoints:
             for other_cp in cp.connected_points:
-                lua_string_connman += self.generate_pretense_zone_connection(
-                    connected_points, cp.name, other_cp.name
+                lua_connman.append(
+                    self.generate_pretense_zone_connection(
+                        connected_points, cp.name, other_cp.name
+                    )
                 )
             for sea_connection in cp.shipping_lanes:
-                lua_string_connman += self.generate_pretense_zone_connection(
-                    connected_points,
-                    cp.name,
-                    sea_connection.name,
+                lua_connman.append(
+                    self.generate_pretense_zone_connection(
+                        connected_points,
+                        cp.name,
+                        sea_connection.name,
+                    )
                 )
+            controllable_carrier = (
+                cp.is_fleet
+                and cp.captured
+                and self.game.settings.pretense_controllable_carrier
+            )
+            if controllable_carrier:
+                # Player controllable carriers are never connected to other zones
+                continue
             if len(cp.connected_points) == 0 and len(cp.shipping_lanes) == 0:
+                if not cp.is_fleet:
+                    continue
                 # Also connect carrier and LHA control points to adjacent friendly points
-                if cp.is_fleet and (
-                    not self.game.settings.pretense_controllable_carrier
-                    or not cp.captured
-                ):
-                    num_of_carrier_connections = 0
-                    for (
-                        other_cp
-                    ) in self.game.theater.closest_friendly_control_points_to(cp):
-                        num_of_carrier_connections += 1
-                        if (
-                            num_of_carrier_connections
-                            > PRETENSE_NUMBER_OF_ZONES_TO_CONNECT_CARRIERS_TO
-                        ):
-                            break
-
-                        lua_string_connman += self.generate_pretense_zone_connection(
+                for other_cp in closest_friendly_cps[cp][
+                    :PRETENSE_NUMBER_OF_ZONES_TO_CONNECT_CARRIERS_TO
+                ]:
+                    lua_connman.append(
+                        self.generate_pretense_zone_connection(
                             connected_points, cp.name, other_cp.name
                         )
+                    )
             else:
                 # Finally, connect remaining non-connected points
-                closest_cps = self.game.theater.closest_friendly_control_points_to(cp)
-                for extra_connection in range(
-                    self.game.settings.pretense_extra_zone_connections
-                ):
-                    try:
-                        if (
-                            cp.is_fleet
-                            and cp.captured
-                            and self.game.settings.pretense_controllable_carrier
-                        ):
-                            break
-                        elif (
-                            closest_cps[extra_connection].is_fleet
-                            and closest_cps[extra_connection].captured
-                            and self.game.settings.pretense_controllable_carrier
-                        ):
-                            break
-                        elif len(closest_cps) > extra_connection:
-                            lua_string_connman += (
-                                self.generate_pretense_zone_connection(
-                                    connected_points,
-                                    cp.name,
-                                    closest_cps[extra_connection].name,
-                                )
-                            )
-                        else:
-                            break
-                    except IndexError:
-                        # No more connected points, so no need to continue the loop
+                for other_cp in closest_friendly_cps[cp][
+                    : self.game.settings.pretense_extra_zone_connections
+                ]:
+                    if (
+                        other_cp.is_fleet
+                        and other_cp.captured
+                        and self.game.settings.pretense_controllable_carrier
+                    ):
                         break
+                    lua_connman.append(
+                        self.generate_pretense_zone_connection(
+                            connected_points, cp.name, other_cp.name
+                        )
+                    )
 
-        lua_string_supply = "local redSupply = {\n"
+        lua_supply = ["local redSupply = {\n"]
         # Generate supply
         for cp_side in range(1, 3):
             for cp in self.game.theater.controlpoints:
@@ -1649,29 +1412,20 @@ def generate_pretense_plugin_data(self) -> None:
                 cp_side_captured = cp_side == 2
                 if cp_side_captured != cp.captured:
                     continue
-                cp_name_trimmed = PretenseNameGenerator.pretense_trimmed_cp_name(
-                    cp.name
-                )
-                for mission_type in self.game.pretense_air[cp_side][cp_name_trimmed]:
-                    if mission_type == FlightType.PRETENSE_CARGO:
-                        for air_group in self.game.pretense_air[cp_side][
-                            cp_name_trimmed
-                        ][mission_type]:
-                            lua_string_supply += f"'{air_group}',"
-            lua_string_supply += "}\n"
+                cp_air = self.game.pretense_air[cp_side][trimmed_cp_names[cp]]
+                for air_group in cp_air.get(FlightType.PRETENSE_CARGO, []):
+                    lua_supply.append(f"'{air_group}',")
+            lua_supply.append("}\n")
             if cp_side < 2:
-                lua_string_supply += "local blueSupply = {\n"
-        lua_string_supply += "local offmapZones = {\n"
+                lua_supply.append("local blueSupply = {\n")
+        lua_supply.append("local offmapZones = {\n")
         for cp in self.game.theater.controlpoints:
             if isinstance(cp, Airfield):
-                cp_name_trimmed = PretenseNameGenerator.pretense_trimmed_cp_name(
-                    cp.name
-                )
-                lua_string_supply += f"   zones.{cp_name_trimmed},\n"
-        lua_string_supply += "}\n"
+                cp_name_trimmed = trimmed_cp_names[cp]
+                lua_supply.append(f"   zones.{cp_name_trimmed},\n")
+        lua_supply.append("}\n")
 
-        init_body_1_file = open("./resources/plugins/pretense/init_body_1.lua", "r")
-        init_body_1 = init_body_1_file.read()
+        init_body_1 = load_pretense_init_script("init_body_1.lua")
 
         lua_string_jtac = ""
         for jtac in self.mission_data.jtacs:
@@ -1680,37 +1434,36 @@ def generate_pretense_plugin_data(self) -> None:
                 "CommandFunctions.jtac = JTAC:new({name = '" + jtac.group_name + "'})\n"
             )
 
-        init_body_2_file = open("./resources/plugins/pretense/init_body_2.lua", "r")
-        init_body_2 = init_body_2_file.read()
-
-        init_body_3_file = open("./resources/plugins/pretense/init_body_3.lua", "r")
-        init_body_3 = init_body_3_file.read()
-
-        init_footer_file = open("./resources/plugins/pretense/init_footer.lua", "r")
-        init_footer = init_footer_file.read()
-
-        lua_string = (
-            lua_string_savefile
-            + init_header
-            + lua_string_ground_groups_blue
-            + lua_string_ground_groups_red
-            + init_body_1
-            + lua_string_zones
-            + lua_string_connman
-            + init_body_2
-            + lua_string_jtac
-            + lua_string_carriers
-            + init_body_3
-            + lua_string_supply
-            + init_footer
+        init_body_2 = load_pretense_init_script("init_body_2.lua")
+
+        init_body_3 = load_pretense_init_script("init_body_3.lua")
+
+        init_footer = load_pretense_init_script("init_footer.lua")
+
+        lua_string = "".join(
+            (
+                lua_string_savefile,
+                init_header,
+                lua_string_ground_groups_blue,
+                lua_string_ground_groups_red,
+                init_body_1,
+                *lua_zones,
+                *lua_connman,
+                init_body_2,
+                lua_string_jtac,
+                lua_string_carriers,
+                init_body_3,
+                *lua_supply,
+                init_footer,
+            )
         )
 
         trigger.add_action(DoScript(String(lua_string)))
         self.mission.triggerrules.triggers.append(trigger)
 
-        file1 = open(Path("./resources/plugins/pretense", "pretense_output.lua"), "w")
-        file1.write(lua_string)
-        file1.close()
+        (PRETENSE_PLUGIN_DIR / "pretense_output.lua").write_text(
+            lua_string, encoding="utf-8"
+        )
 
     def inject_lua_trigger(self, contents: str, comment: str) -> None:
         trigger = TriggerStart(comment=comment)
@@ -1718,7 +1471,7 @@ def inject_lua_trigger(self, contents: str, comment: str) -> None:
         self.mission.triggerrules.triggers.append(trigger)
 
     def bypass_plugin_script(self, mnemonic: str) -> None:
-        self.plugin_scripts.append(mnemonic)
+        self.plugin_scripts.add(mnemonic)
 
     def inject_plugin_script(
         self, plugin_mnemonic: str, script: str, script_mnemonic: str
@@ -1727,17 +1480,19 @@ def inject_plugin_script(
             logging.debug(f"Skipping already loaded {script} for {plugin_mnemonic}")
             return
 
-        self.plugin_scripts.append(script_mnemonic)
+        self.plugin_scripts.add(script_mnemonic)
 
         plugin_path = Path("./resources/plugins", plugin_mnemonic)
 
         script_path = Path(plugin_path, script)
-        if not script_path.exists():
+        try:
+            # Resolving strictly checks for existence in the same pass.
+            filename = script_path.resolve(strict=True)
+        except FileNotFoundError:
             logging.error(f"Cannot find {script_path} for plugin {plugin_mnemonic}")
             return
 
         trigger = TriggerStart(comment=f"Load {script_mnemonic}")
-        filename = script_path.resolve()
         fileref = self.mission.map_resource.add_resource_file(filename)
         trigger.add_action(DoScriptFile(fileref))
         self.mission.triggerrules.triggers.append(trigger)
@@ -1752,19 +1507,23 @@ def inject_plugins(self) -> None:
 class LuaValue:
     key: Optional[str]
     value: str | list[str]
+    escaped_value: str
 
     def __init__(self, key: Optional[str], value: str | list[str]):
         self.key = key
         self.value = value
+        # Values are immutable once created, so escape them up front rather than
+        # on every serialization.
+        if isinstance(value, str):
+            self.escaped_value = f'"{escape_string_for_lua(value)}"'
+        else:
+            escaped_values = [f'"{escape_string_for_lua(v)}"' for v in value]
+            self.escaped_value = "{" + ", ".join(escaped_values) + "}"
 
     def serialize(self) -> str:
-        serialized_value = self.key + " = " if self.key else ""
-        if isinstance(self.value, str):
-            serialized_value += f'"{escape_string_for_lua(self.value)}"'
-        else:
-            escaped_values = [f'"{escape_string_for_lua(v)}"' for v in self.value]
-            serialized_value += "{" + ", ".join(escaped_values) + "}"
-        return serialized_value
+        if self.key:
+            return self.key + " = " + self.escaped_value
+        return self.escaped_value
 
 
 class LuaItem(ABC):
@@ -1808,34 +1567,46 @@ def get_or_create_item(self, item_name: Optional[str] = None) -> LuaItem:
         """gets item from the LuaArray or creates one if it does not exist already"""
         raise NotImplementedError
 
-    @abstractmethod
-    def serialize(self) -> str:
+    def serialize_value(self) -> str:
         if isinstance(self.value, LuaValue):
             return self.value.serialize()
         else:
             serialized_data = [d.serialize() for d in self.value]
             return "{" + ", ".join(serialized_data) + "}"
 
+    @abstractmethod
+    def serialize(self, out: list[str], level: int = 0) -> None:
+        """appends the serialized fragments of the item to out"""
+        raise NotImplementedError
+
+    def to_string(self) -> str:
+        """serialize the item to a string"""
+        out: list[str] = []
+        self.serialize(out)
+        return "".join(out)
+
 
 class LuaData(LuaItem):
     objects: list[LuaData]
+    objects_by_name: dict[str, LuaData]
     base_name: Optional[str]
 
     def __init__(self, name: Optional[str], is_base_name: bool = True):
         self.objects = []
+        self.objects_by_name = {}
         self.base_name = name if is_base_name else None
         super().__init__(name)
 
     def add_item(self, item_name: Optional[str] = None) -> LuaItem:
         item = LuaData(item_name, False)
         self.objects.append(item)
+        if item_name is not None:
+            # get_item returns the first item with a given name
+            self.objects_by_name.setdefault(item_name, item)
         return item
 
     def get_item(self, item_name: str) -> Optional[LuaItem]:
-        for lua_object in self.objects:
-            if lua_object.name == item_name:
-                return lua_object
-        return None
+        return self.objects_by_name.get(item_name)
 
     def get_or_create_item(self, item_name: Optional[str] = None) -> LuaItem:
         if item_name:
@@ -1844,44 +1615,37 @@ def get_or_create_item(self, item_name: Optional[str] = None) -> LuaItem:
                 return item
         return self.add_item(item_name)
 
-    def serialize(self, level: int = 0) -> str:
-        """serialize the LuaData to a string"""
-        serialized_data: list[str] = []
-        serialized_name = ""
-        linebreak = "\n"
-        tab = "\t"
-        tab_end = ""
-        for _ in range(level):
-            tab += "\t"
-            tab_end += "\t"
-        if self.base_name:
-            # Only used for initialization of the object in lua
-            serialized_name += self.base_name + " = "
-        if self.objects:
+    def serialize(self, out: list[str], level: int = 0) -> None:
+        """serialize the LuaData into out"""
+        # Nested tables can get deep, so walk them with an explicit stack of
+        # pending (item, level) pairs and literal closing/separator fragments.
+        pending: list[tuple[LuaData, int] | str] = [(self, level)]
+        while pending:
+            entry = pending.pop()
+            if isinstance(entry, str):
+                out.append(entry)
+                continue
+            item, item_level = entry
+            if not item.objects:
+                # key with value or only value
+                if item.name:
+                    out.append(item.name + " = ")
+                out.append(item.serialize_value())
+                continue
             # nested objects
-            serialized_objects = [o.serialize(level + 1) for o in self.objects]
-            if self.name:
-                if self.name is not self.base_name:
-                    serialized_name += self.name + " = "
-            serialized_data.append(
-                serialized_name
-                + "{"
-                + linebreak
-                + tab
-                + ("," + linebreak + tab).join(serialized_objects)
-                + linebreak
-                + tab_end
-                + "}"
-            )
-        else:
-            # key with value
-            if self.name:
-                serialized_data.append(self.name + " = " + super().serialize())
-            # only value
-            else:
-                serialized_data.append(super().serialize())
-
-        return "\n".join(serialized_data)
+            if item.base_name:
+                # Only used for initialization of the object in lua
+                out.append(item.base_name + " = ")
+            if item.name and item.name is not item.base_name:
+                out.append(item.name + " = ")
+            tab = "\t" * (item_level + 1)
+            out.append("{\n" + tab)
+            pending.append("\n" + "\t" * item_level + "}")
+            separator = ",\n" + tab
+            for lua_object in reversed(item.objects[1:]):
+                pending.append((lua_object, item_level + 1))
+                pending.append(separator)
+            pending.append((item.objects[0], item_level + 1))
 
     def create_operations_lua(self) -> str:
         """crates the liberation lua script for the dcs mission"""
@@ -1890,4 +1654,4 @@ def create_operations_lua(self) -> str:
 env.info("DCSRetribution|: setting configuration table")
 """
 
-        return lua_prefix + self.serialize()
+        return lua_prefix + self.to_string()
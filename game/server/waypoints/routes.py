@@ -18,21 +18,24 @@
 
 
 def waypoints_for_flight(flight: Flight) -> list[FlightWaypointJs]:
-    departure = FlightWaypointJs.for_waypoint(
-        FlightWaypoint(
-            "TAKEOFF",
-            FlightWaypointType.TAKEOFF,
-            flight.departure.position,
-            meters(0),
-            "RADIO",
-        ),
-        flight,
-        0,
-    )
-    return [departure] + [
+    waypoints = [
+        FlightWaypointJs.for_waypoint(
+            FlightWaypoint(
+                "TAKEOFF",
+                FlightWaypointType.TAKEOFF,
+                flight.departure.position,
+                meters(0),
+                "RADIO",
+            ),
+            flight,
+            0,
+        )
+    ]
+    waypoints.extend(
         FlightWaypointJs.for_waypoint(w, flight, i)
         for i, w in enumerate(flight.flight_plan.waypoints, 1)
-    ]
+    )
+    return waypoints
 
 
 @router.get(
@@ -91,13 +94,14 @@ def update_package_waypoints_if_primary_flight(
 ) -> None:
     wpts = flight.package.waypoints
     if flight is flight.package.primary_flight and wpts:
+        is_ingress = "INGRESS" in waypoint.waypoint_type.name
         if waypoint.waypoint_type is FlightWaypointType.JOIN:
             wpts.join = waypoint.position
         elif waypoint.waypoint_type is FlightWaypointType.SPLIT:
             wpts.split = waypoint.position
         elif waypoint.waypoint_type is FlightWaypointType.REFUEL:
             wpts.refuel = waypoint.position
-        elif "INGRESS" in waypoint.waypoint_type.name:
+        elif is_ingress:
             wpts.ingress = waypoint.position
             wpts.initial = wpts.get_initial_point(
                 waypoint.position, flight.package.target.position
@@ -108,12 +112,15 @@ def update_package_waypoints_if_primary_flight(
             if f is flight:
                 continue
             for wpt in f.flight_plan.iter_waypoints():
-                if wpt.waypoint_type == waypoint.waypoint_type or (
-                    "INGRESS" in wpt.waypoint_type.name
-                    and "INGRESS" in waypoint.waypoint_type.name
+                if wpt.waypoint_type is waypoint.waypoint_type or (
+                    is_ingress and "INGRESS" in wpt.waypoint_type.name
                 ):
-                    wpt.position = waypoint.position.new_in_same_map(
-                        waypoint.position.x, waypoint.position.y
-                    )
-                    events.update_flight(f)
+                    if (
+                        wpt.position.x != waypoint.position.x
+                        or wpt.position.y != waypoint.position.y
+                    ):
+                        wpt.position = waypoint.position.new_in_same_map(
+                            waypoint.position.x, waypoint.position.y
+                        )
+                        events.update_flight(f)
                     break
@@ -18,6 +18,14 @@
     from .squadron import Squadron
 
 
+def priority_indices(aircraft: list[AircraftType]) -> dict[AircraftType, int]:
+    """Maps each aircraft type to its first index in the given priority list."""
+    indices: dict[AircraftType, int] = {}
+    for index, aircraft_type in enumerate(aircraft):
+        indices.setdefault(aircraft_type, index)
+    return indices
+
+
 class AirWing:
     def __init__(self, player: bool, game: Game, faction: Faction) -> None:
         self.player = player
@@ -57,6 +65,7 @@ def best_squadrons_for(
     ) -> list[Squadron]:
         airfield_cache = ObjectiveDistanceCache.get_closest_airfields(location)
         best_aircraft = AircraftType.priority_list_for_task(task)
+        priority = priority_indices(best_aircraft)
         ordered: list[Squadron] = []
         for control_point in airfield_cache.operational_airfields:
             if control_point.captured != self.player:
@@ -73,14 +82,15 @@ def best_squadrons_for(
                     location, task, size, heli, this_turn, ignore_range
                 ):
                     capable_at_base.append(squadron)
-                    if squadron.aircraft not in best_aircraft:
+                    if squadron.aircraft not in priority:
                         # If it is not already in the list it should be the last one
+                        priority[squadron.aircraft] = len(best_aircraft)
                         best_aircraft.append(squadron.aircraft)
 
             ordered.extend(
                 sorted(
                     capable_at_base,
-                    key=lambda s: best_aircraft.index(s.aircraft),
+                    key=lambda s: priority[s.aircraft],
                 )
             )
 
@@ -93,7 +103,7 @@ def best_squadrons_for(
                 int(s.primary_task != task)
                 + Distance.from_meters(s.location.distance_to(location)).nautical_miles
                 / self.settings.primary_task_distance_factor
-                + best_aircraft.index(s.aircraft) / len(best_aircraft),
+                + priority[s.aircraft] / len(best_aircraft),
             ),
         )
 
@@ -117,17 +127,19 @@ def best_available_aircrafts_for(self, task: FlightType) -> list[AircraftType]:
         """Returns an ordered list of available aircrafts for the given task"""
         aircrafts = []
         best_aircraft_for_task = AircraftType.priority_list_for_task(task)
+        priority = priority_indices(best_aircraft_for_task)
         for aircraft, squadrons in self.squadrons.items():
             for squadron in squadrons:
                 if squadron.untasked_aircraft and squadron.capable_of(task):
                     aircrafts.append(aircraft)
-                    if aircraft not in best_aircraft_for_task:
+                    if aircraft not in priority:
+                        priority[aircraft] = len(best_aircraft_for_task)
                         best_aircraft_for_task.append(aircraft)
                     break
         # Sort the list ordered by the best capability
         return sorted(
             aircrafts,
-            key=lambda ac: best_aircraft_for_task.index(ac),
+            key=lambda ac: priority[ac],
         )
 
     def auto_assignable_for_task(self, task: FlightType) -> Iterator[Squadron]:
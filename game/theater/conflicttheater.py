@@ -6,6 +6,7 @@
 from typing import Iterator, List, Optional, TYPE_CHECKING, Tuple, Any
 from uuid import UUID
 
+import numpy as np
 from dcs.mapping import Point
 from dcs.terrain.terrain import Terrain
 from dcs.triggers import TriggerZone
@@ -274,6 +275,33 @@ def closest_friendly_control_points_to(
 
         return closest_cps
 
+    def closest_friendly_control_points(
+        self,
+    ) -> dict[ControlPoint, List[ControlPoint]]:
+        """
+        Returns the friendly ControlPoints of every ControlPoint in theater, sorted closest to farthest.
+
+        Computes a single distance matrix per coalition instead of sorting once per
+        ControlPoint as closest_friendly_control_points_to does. Unlike that method,
+        ControlPoints at the same distance are all kept, in theater order, rather than
+        all but the last being dropped.
+        """
+        closest_cps: dict[ControlPoint, List[ControlPoint]] = {}
+        for player in (True, False):
+            control_points = list(self.control_points_for(player))
+            if not control_points:
+                continue
+            positions = np.array(
+                [(cp.position.x, cp.position.y) for cp in control_points]
+            )
+            deltas = positions[:, np.newaxis, :] - positions[np.newaxis, :, :]
+            distances = np.hypot(deltas[..., 0], deltas[..., 1])
+            for idx, order in enumerate(np.argsort(distances, axis=1, kind="stable")):
+                closest_cps[control_points[idx]] = [
+                    control_points[other_idx] for other_idx in order if other_idx != idx
+                ]
+        return closest_cps
+
     def find_control_point_by_id(self, cp_id: UUID) -> ControlPoint:
         for i in self.controlpoints:
             if i.id == cp_id:
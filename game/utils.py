@@ -475,9 +475,12 @@ def dcs_to_shapely_point(point: Point) -> ShapelyPoint:
     return ShapelyPoint(point.x, point.y)
 
 
+# Double quotes are the lua string delimiter and backslashes (the path separator on
+# Windows) would be read as escapes, so both are replaced in a single pass.
+LUA_ESCAPE_TABLE = str.maketrans({'"': "'", os.sep: "/"})
+
+
 def escape_string_for_lua(value: str) -> str:
     """Escapes special characters from a string.
     This prevents scripting errors in lua scripts"""
-    value = value.replace('"', "'")  # Replace Double Quote as this is the delimiter
-    value = value.replace(os.sep, "/")  # Replace Backslash as path separator
-    return "{0}".format(value)
+    return value.translate(LUA_ESCAPE_TABLE)
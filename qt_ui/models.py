@@ -247,6 +247,10 @@ def __init__(self, game_model: GameModel, ato: AirTaskingOrder) -> None:
         super().__init__()
         self.game_model = game_model
         self.ato = ato
+        # Packages are hashed by identity, so this answers "is this package in the ATO"
+        # without scanning it. Packages added or removed by the game rather than this
+        # model are picked up by replace_from_game on the next game update.
+        self.package_index: set[Package] = set(ato.packages)
         self.package_models = DeletableChildModelManager(PackageModel, game_model)
         self.game_model.sim_controller.sim_update.connect(self.on_sim_update)
 
@@ -272,6 +276,7 @@ def add_package(self, package: Package) -> None:
         with self.game_model.sim_controller.paused_sim():
             self.beginInsertRows(QModelIndex(), self.rowCount(), self.rowCount())
             self.ato.add_package(package)
+            self.package_index.add(package)
             # We do not need to send events for new flights in the package here. Events
             # were already sent when the flights were added to the in-progress package.
             self.endInsertRows()
@@ -306,6 +311,7 @@ def _delete_package(self, package: Package) -> None:
         index = self.ato.packages.index(package)
         self.beginRemoveRows(QModelIndex(), index, index)
         self.ato.remove_package(package)
+        self.package_index.discard(package)
         self.endRemoveRows()
         # noinspection PyUnresolvedReferences
         self.client_slots_changed.emit()
@@ -336,6 +342,7 @@ def replace_from_game(self, player: bool) -> None:
                 self.ato = self.game.red.ato
         else:
             self.ato = AirTaskingOrder()
+        self.package_index = set(self.ato.packages)
         self.endResetModel()
         # noinspection PyUnresolvedReferences
         self.client_slots_changed.emit()
@@ -345,10 +352,11 @@ def get_package_model(self, index: QModelIndex) -> PackageModel:
         return self.package_models.acquire(self.package_at_index(index))
 
     def find_matching_package_model(self, package: Package) -> Optional[PackageModel]:
-        for model in self.packages:
-            if model.package == package:
-                return model
-        return None
+        # Look the model up directly rather than acquiring a model for every
+        # package in the ATO.
+        if package not in self.package_index:
+            return None
+        return self.package_models.acquire(package)
 
     @property
     def packages(self) -> Iterator[PackageModel]:
@@ -427,6 +435,11 @@ def transfer_at_index(self, index: QModelIndex) -> TransferOrder:
         """Returns the transfer located at the given index."""
         return self.transfers.transfer_at_index(index.row())
 
+    def refresh(self) -> None:
+        """Updates the model after the pending transfers changed outside of it."""
+        self.beginResetModel()
+        self.endResetModel()
+
 
 class AirWingModel(QAbstractListModel):
     """The model for an air wing."""
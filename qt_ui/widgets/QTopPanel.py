@@ -1,8 +1,8 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
 
 from PySide6.QtWidgets import (
-    QDialog,
     QFrame,
     QGroupBox,
     QHBoxLayout,
@@ -12,6 +12,7 @@
 
 import qt_ui.uiconstants as CONST
 from game import Game, persistency
+from game.ato.flight import Flight
 from game.ato.flightstate import Uninitialized
 from game.ato.package import Package
 from game.ato.traveltime import TotEstimator
@@ -32,6 +33,14 @@
 from qt_ui.windows.QWaitingForMissionResultWindow import QWaitingForMissionResultWindow
 
 
+@dataclass
+class LaunchPreflight:
+    """Results of the pre-launch checks of the player's ATO."""
+
+    has_clients: bool = False
+    missing_pilots: list[tuple[Package, Flight]] = field(default_factory=list)
+
+
 class QTopPanel(QFrame):
     def __init__(
         self, game_model: GameModel, sim_controller: SimController, ui_flags: UiFlags
@@ -39,11 +48,14 @@ def __init__(
         super(QTopPanel, self).__init__()
         self.game_model = game_model
         self.sim_controller = sim_controller
-        self.dialog: Optional[QDialog] = None
+        self.air_wing_dialog: Optional[AirWingDialog] = None
+        self.transfers_dialog: Optional[PendingTransfersDialog] = None
+        self._last_game: Optional[Game] = None
 
         self.setMaximumHeight(70)
 
         self.conditionsWidget = QConditionsWidget(sim_controller)
+        self.tooltip_cloud_base: Optional[int] = None
         self.budgetBox = QBudgetBox(self.game)
 
         pass_turn_text = "Pass Turn"
@@ -124,6 +136,11 @@ def game(self) -> Optional[Game]:
         return self.game_model.game
 
     def setGame(self, game: Optional[Game]):
+        if game is not self._last_game:
+            self.discard_dialogs()
+            self._last_game = game
+        else:
+            self.refresh_dialogs()
         if game is None:
             return
 
@@ -132,12 +149,16 @@ def setGame(self, game: Optional[Game]):
 
         self.conditionsWidget.setCurrentTurn(game.turn, game.conditions)
 
-        if game.conditions.weather.clouds:
-            base_m = game.conditions.weather.clouds.base
-            base_ft = int(meters(base_m).feet)
-            self.conditionsWidget.setToolTip(f"Cloud Base: {base_m}m / {base_ft}ft")
-        else:
-            self.conditionsWidget.setToolTip("")
+        clouds = game.conditions.weather.clouds
+        base_m = clouds.base if clouds else None
+        if base_m != self.tooltip_cloud_base:
+            # Only rebuild the tooltip when the weather has actually changed.
+            self.tooltip_cloud_base = base_m
+            if base_m is not None:
+                base_ft = int(meters(base_m).feet)
+                self.conditionsWidget.setToolTip(f"Cloud Base: {base_m}m / {base_ft}ft")
+            else:
+                self.conditionsWidget.setToolTip("")
 
         self.intel_box.set_game(game)
         self.budgetBox.setGame(game)
@@ -154,13 +175,36 @@ def setGame(self, game: Optional[Game]):
         else:
             raise RuntimeError(f"game.turn out of bounds!\n  value = {game.turn}")
 
+    def discard_dialogs(self) -> None:
+        # The dialogs are reused between opens, but they are built for a single game,
+        # so rebuild them when a different game is loaded.
+        for dialog in (self.air_wing_dialog, self.transfers_dialog):
+            if dialog is not None:
+                dialog.deleteLater()
+        self.air_wing_dialog = None
+        self.transfers_dialog = None
+
+    def refresh_dialogs(self) -> None:
+        if self.air_wing_dialog is not None and self.air_wing_dialog.isVisible():
+            self.air_wing_dialog.refresh()
+        if self.transfers_dialog is not None and self.transfers_dialog.isVisible():
+            self.transfers_dialog.refresh()
+
     def open_air_wing(self):
-        self.dialog = AirWingDialog(self.game_model, self.window())
-        self.dialog.show()
+        if self.air_wing_dialog is None:
+            self.air_wing_dialog = AirWingDialog(self.game_model, self.window())
+        else:
+            self.air_wing_dialog.refresh()
+        self.air_wing_dialog.show()
+        self.air_wing_dialog.raise_()
 
     def open_transfers(self):
-        self.dialog = PendingTransfersDialog(self.game_model)
-        self.dialog.show()
+        if self.transfers_dialog is None:
+            self.transfers_dialog = PendingTransfersDialog(self.game_model)
+        else:
+            self.transfers_dialog.refresh()
+        self.transfers_dialog.show()
+        self.transfers_dialog.raise_()
 
     def passTurn(self):
         with logged_duration("Skipping turn"):
@@ -170,6 +214,21 @@ def passTurn(self):
             GameUpdateSignal.get_instance().gameStateChanged(state)
             self.proceedButton.setEnabled(True)
 
+    def launch_preflight(self) -> LaunchPreflight:
+        """Checks every flight of the player's ATO in a single pass.
+
+        The flights are not modified, so the launch can still be cancelled after any
+        of the checks.
+        """
+        preflight = LaunchPreflight()
+        for package in self.game_model.ato_model.ato.packages:
+            for flight in package.flights:
+                if flight.client_count > 0:
+                    preflight.has_clients = True
+                if flight.missing_pilots > 0:
+                    preflight.missing_pilots.append((package, flight))
+        return preflight
+
     def negative_start_packages(self, now: datetime) -> List[Package]:
         packages = []
         for package in self.game_model.ato_model.ato.packages:
@@ -191,13 +250,6 @@ def fix_tots(packages: List[Package]) -> None:
             estimator = TotEstimator(package)
             package.time_over_target = estimator.earliest_tot()
 
-    def ato_has_clients(self) -> bool:
-        for package in self.game.blue.ato.packages:
-            for flight in package.flights:
-                if flight.client_count > 0:
-                    return True
-        return False
-
     def confirm_no_client_launch(self) -> bool:
         result = QMessageBox.question(
             self,
@@ -262,13 +314,9 @@ def confirm_negative_start_time(self, negative_starts: List[Package]) -> bool:
             return True
         return False
 
-    def check_no_missing_pilots(self) -> bool:
-        missing_pilots = []
-        for package in self.game.blue.ato.packages:
-            for flight in package.flights:
-                if flight.missing_pilots > 0:
-                    missing_pilots.append((package, flight))
-
+    def check_no_missing_pilots(
+        self, missing_pilots: list[tuple[Package, Flight]]
+    ) -> bool:
         if not missing_pilots:
             return False
 
@@ -294,12 +342,15 @@ def check_no_missing_pilots(self) -> bool:
 
     def launch_mission(self):
         """Finishes planning and waits for mission completion."""
-        if not self.ato_has_clients() and not self.confirm_no_client_launch():
+        preflight = self.launch_preflight()
+        if not preflight.has_clients and not self.confirm_no_client_launch():
             return
 
-        if self.check_no_missing_pilots():
+        if self.check_no_missing_pilots(preflight.missing_pilots):
             return
 
+        # Checking start times initializes the flight states, so this must wait until
+        # the prompts above can no longer cancel the launch.
         negative_starts = self.negative_start_packages(
             self.sim_controller.current_time_in_sim
         )
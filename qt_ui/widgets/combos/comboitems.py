@@ -0,0 +1,24 @@
+"""Bulk population of combo boxes."""
+
+from typing import Any, Iterable
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItem, QStandardItemModel
+from PySide6.QtWidgets import QComboBox
+
+
+def add_combo_items(combo: QComboBox, items: Iterable[tuple[str, Any]]) -> None:
+    """Appends (text, data) pairs to the combo box in a single model insert.
+
+    Equivalent to calling addItem for each pair, but the view and the combo box are
+    only notified once rather than once per item. The combo box must use its default
+    QStandardItemModel.
+    """
+    model = combo.model()
+    assert isinstance(model, QStandardItemModel)
+    rows = []
+    for text, data in items:
+        item = QStandardItem(text)
+        item.setData(data, Qt.ItemDataRole.UserRole)
+        rows.append(item)
+    model.invisibleRootItem().appendRows(rows)
@@ -1,11 +1,18 @@
+import logging
 from collections import defaultdict
-from typing import Iterable, Iterator, Optional, Any
+from functools import cached_property, partial
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
 
 import yaml
 from PySide6.QtCore import (
     QItemSelection,
     QItemSelectionModel,
+    QObject,
+    QRunnable,
     QSize,
+    QThreadPool,
+    QTimer,
     Qt,
     Signal,
 )
@@ -50,6 +57,45 @@
 from qt_ui.widgets.combos.QSquadronLiverySelector import SquadronLiverySelector
 from qt_ui.widgets.combos.primarytaskselector import PrimaryTaskSelector
 
+try:
+    # Use libyaml when PyYAML was built with it, it is much faster.
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
+# The YAML emitter writes many small fragments, so buffer them into a few large writes.
+AIR_WING_FILE_BUFFER_SIZE = 1 << 20
+
+# Ferry flights are not plannable, so they get no auto-assign control.
+PLANNABLE_FLIGHT_TYPES = tuple(t for t in FlightType if t is not FlightType.FERRY)
+
+
+class AirWingFileTaskSignals(QObject):
+    finished = Signal(object)
+    failed = Signal(str)
+
+
+class AirWingFileTask(QRunnable):
+    """Runs air wing config file I/O on the global thread pool.
+
+    The result of the task is delivered by the finished signal, or the error message by
+    the failed signal. Both are received on the UI thread.
+    """
+
+    def __init__(self, task: Callable[[], Any]) -> None:
+        super().__init__()
+        self.task = task
+        self.signals = AirWingFileTaskSignals()
+
+    def run(self) -> None:
+        try:
+            result = self.task()
+        except Exception as ex:
+            logging.exception("Air wing config file operation failed")
+            self.signals.failed.emit(str(ex))
+            return
+        self.signals.finished.emit(result)
+
 
 class QMissionType(QCheckBox):
     def __init__(
@@ -74,13 +120,10 @@ def __init__(self, squadron: Squadron) -> None:
         self.addWidget(QLabel("Mission Type"), 0, 0)
         self.addWidget(QLabel("Auto-Assign"), 0, 1)
 
-        for i, task in enumerate(FlightType):
-            if task is FlightType.FERRY:
-                # Not plannable so just skip it.
-                continue
-            auto_assignable = task in squadron.auto_assignable_mission_types
+        auto_assignable_types = squadron.auto_assignable_mission_types
+        for i, task in enumerate(PLANNABLE_FLIGHT_TYPES):
             mission_type = QMissionType(
-                task, squadron.capable_of(task), auto_assignable
+                task, squadron.capable_of(task), task in auto_assignable_types
             )
             self.mission_types.append(mission_type)
 
@@ -95,28 +138,30 @@ def auto_assignable_mission_types(self) -> Iterator[FlightType]:
 
     def replace_squadron(self, squadron: Squadron) -> None:
         self.squadron = squadron
+        auto_assignable_types = squadron.auto_assignable_mission_types
         for mission_type in self.mission_types:
-            mission_type.setChecked(
-                mission_type.flight_type in self.squadron.auto_assignable_mission_types
-            )
+            mission_type.setChecked(mission_type.flight_type in auto_assignable_types)
 
 
 class SquadronBaseSelector(QComboBox):
     """A combo box for selecting a squadrons home air base.
 
     The combo box will automatically be populated with all air bases compatible with the
-    squadron.
+    squadron. The compatible bases for each aircraft type are stored in
+    compatible_bases, which may be shared between selectors for the same bases.
     """
 
     def __init__(
         self,
-        bases: Iterable[ControlPoint],
+        bases: Sequence[ControlPoint],
         selected_base: Optional[ControlPoint],
         aircraft_type: Optional[AircraftType],
+        compatible_bases: Optional[dict[AircraftType, list[ControlPoint]]] = None,
     ) -> None:
         super().__init__()
         self.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToContents)
-        self.bases = list(bases)
+        self.bases = bases
+        self.compatible_bases = {} if compatible_bases is None else compatible_bases
         self.set_aircraft_type(aircraft_type)
 
         if selected_base:
@@ -124,21 +169,34 @@ def __init__(
         # TODO can we get a prefered base if none is selected?
 
     def set_aircraft_type(self, aircraft_type: Optional[AircraftType]):
-        self.clear()
-        if aircraft_type:
-            for base in self.bases:
-                if not base.can_operate(aircraft_type) and not isinstance(
-                    base, Airfield
-                ):
-                    continue
-                self.addItem(base.name, base)
-            self.model().sort(0)
-            self.setEnabled(True)
-        else:
-            self.addItem("Select aircraft type first", None)
-            self.setEnabled(False)
+        self.setUpdatesEnabled(False)
+        try:
+            self.clear()
+            if aircraft_type:
+                for base in self.compatible_bases_for(aircraft_type):
+                    self.addItem(base.name, base)
+                self.setEnabled(True)
+            else:
+                self.addItem("Select aircraft type first", None)
+                self.setEnabled(False)
+        finally:
+            self.setUpdatesEnabled(True)
         self.update()
 
+    def compatible_bases_for(self, aircraft_type: AircraftType) -> list[ControlPoint]:
+        if aircraft_type not in self.compatible_bases:
+            # Sorted here so the combo box model doesn't need to be sorted each time
+            # it is populated.
+            self.compatible_bases[aircraft_type] = sorted(
+                (
+                    base
+                    for base in self.bases
+                    if base.can_operate(aircraft_type) or isinstance(base, Airfield)
+                ),
+                key=lambda base: base.name,
+            )
+        return self.compatible_bases[aircraft_type]
+
 
 class SquadronSizeSpinner(QSpinBox):
     def __init__(self, starting_size: int, parent: QWidget | None) -> None:
@@ -161,21 +219,42 @@ def __init__(self, starting_size: int, parent: QWidget | None) -> None:
 
 
 class AirWingConfigParkingTracker(QWidget):
-    allocation_changed = Signal()
+    # Emits the set of control points whose allocation changed, or None if every control
+    # point should be considered changed.
+    allocation_changed = Signal(object)
 
     def __init__(self, squadrons: Iterable[Squadron]) -> None:
         super().__init__()
-        self.by_cp: dict[ControlPoint, set[Squadron]] = defaultdict(set)
+        # Changes arrive in bursts (e.g. holding a size spinner arrow), so coalesce
+        # them into a single allocation_changed per event loop iteration.
+        self.pending_change = QTimer(self)
+        self.pending_change.setSingleShot(True)
+        self.pending_change.setInterval(0)
+        self.pending_change.timeout.connect(  # type: ignore[attr-defined]
+            self.emit_allocation_changed
+        )
+        self.changed_control_points: Optional[set[ControlPoint]] = set()
+        # Control points are removed from by_cp and used_parking once they no longer
+        # have any squadrons.
+        self.by_cp: dict[ControlPoint, set[Squadron]] = {}
+        # Running total of max_size of the squadrons in by_cp, kept in sync so that
+        # used_parking_at doesn't need to re-sum on every change notification.
+        self.used_parking: dict[ControlPoint, int] = {}
+        # Parking capacity only depends on the base and aircraft type, neither of
+        # which change while the dialog is open.
+        self.parking_capacity: dict[
+            tuple[ControlPoint, AircraftType, bool], tuple[int, Optional[int]]
+        ] = {}
         for squadron in squadrons:
             self.add_squadron(squadron)
 
     def add_squadron(self, squadron: Squadron) -> None:
-        self.by_cp[squadron.location].add(squadron)
-        self.signal_change()
+        self.track(squadron, squadron.location)
+        self.signal_change(squadron.location)
 
     def remove_squadron(self, squadron: Squadron) -> None:
-        self.by_cp[squadron.location].remove(squadron)
-        self.signal_change()
+        self.untrack(squadron, squadron.location)
+        self.signal_change(squadron.location)
 
     def relocate_squadron(
         self,
@@ -183,16 +262,75 @@ def relocate_squadron(
         prior_location: ControlPoint,
         new_location: ControlPoint,
     ) -> None:
-        self.by_cp[prior_location].remove(squadron)
-        self.by_cp[new_location].add(squadron)
+        self.untrack(squadron, prior_location)
+        self.track(squadron, new_location)
         squadron.relocate_to(new_location)
-        self.signal_change()
+        self.signal_change(prior_location, new_location)
+
+    def update_max_size(self, squadron: Squadron, max_size: int) -> None:
+        if squadron in self.by_cp.get(squadron.location, ()):
+            self.used_parking[squadron.location] += max_size - squadron.max_size
+        squadron.max_size = max_size
+        self.signal_change(squadron.location)
+
+    def track(self, squadron: Squadron, location: ControlPoint) -> None:
+        squadrons = self.by_cp.setdefault(location, set())
+        if squadron not in squadrons:
+            squadrons.add(squadron)
+            self.used_parking[location] = (
+                self.used_parking.get(location, 0) + squadron.max_size
+            )
+
+    def untrack(self, squadron: Squadron, location: ControlPoint) -> None:
+        squadrons = self.by_cp.get(location)
+        if squadrons is None or squadron not in squadrons:
+            return
+        squadrons.remove(squadron)
+        if squadrons:
+            self.used_parking[location] -= squadron.max_size
+        else:
+            del self.by_cp[location]
+            del self.used_parking[location]
 
     def used_parking_at(self, control_point: ControlPoint) -> int:
-        return sum(s.max_size for s in self.by_cp[control_point])
+        return self.used_parking.get(control_point, 0)
+
+    def parking_capacity_at(
+        self,
+        control_point: ControlPoint,
+        aircraft: AircraftType,
+        ground_start_ai_planes: bool,
+    ) -> tuple[int, Optional[int]]:
+        """Returns the total parking and the number of slots that fit the aircraft.
+
+        The number of fitting slots is None for control points without an airport.
+        """
+        key = (control_point, aircraft, ground_start_ai_planes)
+        if key not in self.parking_capacity:
+            total_slots = control_point.total_aircraft_parking(
+                ParkingType().from_aircraft(aircraft, ground_start_ai_planes)
+            )
+            fitting_slots = None
+            if ap := control_point.dcs_airport:
+                fitting_slots = len(ap.free_parking_slots(aircraft.dcs_unit_type))
+            self.parking_capacity[key] = total_slots, fitting_slots
+        return self.parking_capacity[key]
+
+    def signal_change(self, *control_points: ControlPoint) -> None:
+        """Schedules an allocation_changed for the given control points.
+
+        If no control points are given, all control points are considered changed.
+        """
+        if not control_points:
+            self.changed_control_points = None
+        elif self.changed_control_points is not None:
+            self.changed_control_points.update(control_points)
+        self.pending_change.start()
 
-    def signal_change(self) -> None:
-        self.allocation_changed.emit()
+    def emit_allocation_changed(self) -> None:
+        changed = self.changed_control_points
+        self.changed_control_points = set()
+        self.allocation_changed.emit(changed)
 
 
 class SquadronConfigurationBox(QGroupBox):
@@ -204,6 +342,8 @@ def __init__(
         coalition: Coalition,
         squadron: Squadron,
         parking_tracker: AirWingConfigParkingTracker,
+        bases: list[ControlPoint],
+        compatible_bases: dict[AircraftType, list[ControlPoint]],
         aircraft_present: bool,
     ) -> None:
         super().__init__()
@@ -211,6 +351,8 @@ def __init__(
         self.coalition = coalition
         self.squadron = squadron
         self.parking_tracker = parking_tracker
+        self.bases = bases
+        self.compatible_bases = compatible_bases
         self.aircraft_present = aircraft_present
 
         columns = QHBoxLayout()
@@ -244,6 +386,12 @@ def __init__(
 
         left_column.addWidget(QLabel("Livery:"))
         self.livery_selector = SquadronLiverySelector(squadron)
+        # The liveries don't change when the squadron is replaced with a preset, so the
+        # index can be reused by bind_data. setdefault keeps the first match, as
+        # findText would.
+        self.livery_index: dict[Optional[str], int] = {}
+        for i in range(self.livery_selector.count()):
+            self.livery_index.setdefault(self.livery_selector.itemText(i), i)
         left_column.addWidget(self.livery_selector)
 
         task_and_size_row = QHBoxLayout()
@@ -264,27 +412,25 @@ def __init__(
 
         left_column.addWidget(QLabel("Base:"))
         self.base_selector = SquadronBaseSelector(
-            game.theater.control_points_for(squadron.player),
+            self.bases,
             squadron.location,
             squadron.aircraft,
+            self.compatible_bases,
         )
         self.base_selector.currentIndexChanged.connect(self.relocate_squadron)
         left_column.addWidget(self.base_selector)
 
         self.parking_label = QLabel()
         self.update_parking_label()
-        self.parking_tracker.allocation_changed.connect(self.update_parking_label)
+        self.parking_tracker.allocation_changed.connect(self.on_allocation_changed)
         left_column.addWidget(self.parking_label)
 
-        if not squadron.player and squadron.aircraft.flyable:
+        if not squadron.player:
             player_label = QLabel("Player slots not available for opfor")
         elif not squadron.aircraft.flyable:
             player_label = QLabel("Player slots not available for non-flyable aircraft")
         else:
-            msg1 = "Player slots not available for opfor"
-            msg2 = "Player slots not available for non-flyable aircraft"
-            text = msg2 if squadron.player else msg1
-            player_label = QLabel(text)
+            player_label = QLabel("Players (one per line):")
         left_column.addWidget(player_label)
 
         self.player_list = QTextEdit(
@@ -321,8 +467,9 @@ def bind_data(self) -> None:
             self.name_edit.setText(self.squadron.name)
             self.nickname_edit.setText(self.squadron.nickname)
             self.primary_task_selector.setCurrentText(self.squadron.primary_task.value)
-            index = self.livery_selector.findText(self.squadron.livery)
-            self.livery_selector.setCurrentIndex(index)
+            self.livery_selector.setCurrentIndex(
+                self.livery_index.get(self.squadron.livery, -1)
+            )
             self.max_size_selector.setValue(self.squadron.max_size)
             self.base_selector.setCurrentText(self.squadron.location.name)
             self.player_list.setText(
@@ -332,6 +479,12 @@ def bind_data(self) -> None:
         finally:
             self.blockSignals(old_state)
 
+    def on_allocation_changed(
+        self, control_points: Optional[set[ControlPoint]]
+    ) -> None:
+        if control_points is None or self.squadron.location in control_points:
+            self.update_parking_label()
+
     def update_parking_label(self) -> None:
         required_slots = self.parking_tracker.used_parking_at(self.squadron.location)
         required_slots_string = (
@@ -339,14 +492,12 @@ def update_parking_label(self) -> None:
             if self.aircraft_present
             else ""
         )
-        total_slots = self.squadron.location.total_aircraft_parking(
-            ParkingType().from_aircraft(
-                self.squadron.aircraft, self.game.settings.ground_start_ai_planes
-            )
+        total_slots, fitting_slots = self.parking_tracker.parking_capacity_at(
+            self.squadron.location,
+            self.squadron.aircraft,
+            self.game.settings.ground_start_ai_planes,
         )
-        slots = "N/A"
-        if ap := self.squadron.location.dcs_airport:
-            slots = len(ap.free_parking_slots(self.squadron.aircraft.dcs_unit_type))
+        slots = "N/A" if fitting_slots is None else fitting_slots
         self.parking_label.setText(
             f"{required_slots_string}"
             f"Total parking slots available: {total_slots}<br/>"
@@ -354,8 +505,9 @@ def update_parking_label(self) -> None:
         )
 
     def update_max_size(self) -> None:
-        self.squadron.max_size = self.max_size_selector.value()
-        self.parking_tracker.signal_change()
+        self.parking_tracker.update_max_size(
+            self.squadron, self.max_size_selector.value()
+        )
 
     def relocate_squadron(self) -> None:
         location = self.base_selector.currentData()
@@ -401,10 +553,14 @@ def return_players_to_squadron(self) -> None:
             return
 
         player_names = self.player_list.toPlainText().splitlines()
-        # Prepend player pilots so they get set active first.
+        if not player_names:
+            return
+        # Prepend player pilots so they get set active first. The pool is rebuilt
+        # rather than modified in place since it may be shared with the SquadronDef.
         self.squadron.pilot_pool = [
-            Pilot(n, player=True) for n in player_names
-        ] + self.squadron.pilot_pool
+            *(Pilot(n, player=True) for n in player_names),
+            *self.squadron.pilot_pool,
+        ]
 
     def replace_with_preset(self) -> None:
         new_squadron = self.pick_replacement_squadron()
@@ -417,7 +573,7 @@ def replace_with_preset(self) -> None:
         self.parking_tracker.add_squadron(self.squadron)
         self.bind_data()
         self.mission_types.replace_squadron(self.squadron)
-        self.parking_tracker.signal_change()
+        self.parking_tracker.signal_change(self.squadron.location)
 
     def reset_title(self) -> None:
         self.setTitle(f"{self.name_edit.text()} - {self.squadron.aircraft}")
@@ -457,13 +613,17 @@ def __init__(
         coalition: Coalition,
         squadrons: list[Squadron],
         parking_tracker: AirWingConfigParkingTracker,
+        bases: list[ControlPoint],
+        compatible_bases: dict[AircraftType, list[ControlPoint]],
         aircraft_present: bool,
     ) -> None:
         super().__init__()
         self.game = game
         self.coalition = coalition
-        self.squadron_configs = []
+        self.squadron_configs: list[SquadronConfigurationBox] = []
         self.parking_tracker = parking_tracker
+        self.bases = bases
+        self.compatible_bases = compatible_bases
         self.aircraft_present = aircraft_present
         for squadron in squadrons:
             self.add_squadron(squadron)
@@ -474,16 +634,15 @@ def apply(self) -> list[Squadron]:
             keep_squadrons.append(squadron_config.apply())
         return keep_squadrons
 
-    def remove_squadron(self, squadron: Squadron) -> None:
+    def remove_squadron(
+        self, squadron_config: SquadronConfigurationBox, squadron: Squadron
+    ) -> None:
         self.parking_tracker.remove_squadron(squadron)
-        for squadron_config in self.squadron_configs:
-            if squadron_config.squadron == squadron:
-                squadron_config.deleteLater()
-                self.squadron_configs.remove(squadron_config)
-                squadron.coalition.air_wing.unclaim_squadron_def(squadron)
-                self.update()
-                self.config_changed.emit(squadron.aircraft)
-                return
+        squadron_config.deleteLater()
+        self.squadron_configs.remove(squadron_config)
+        squadron.coalition.air_wing.unclaim_squadron_def(squadron)
+        self.update()
+        self.config_changed.emit(squadron.aircraft)
 
     def add_squadron(self, squadron: Squadron) -> None:
         squadron_config = SquadronConfigurationBox(
@@ -491,9 +650,15 @@ def add_squadron(self, squadron: Squadron) -> None:
             self.coalition,
             squadron,
             self.parking_tracker,
+            self.bases,
+            self.compatible_bases,
             self.aircraft_present,
         )
-        squadron_config.remove_squadron_signal.connect(self.remove_squadron)
+        # Bind the box to the slot so removal doesn't need to search for it. The box's
+        # squadron can't be used as a key since it changes when replaced by a preset.
+        squadron_config.remove_squadron_signal.connect(
+            partial(self.remove_squadron, squadron_config)
+        )
         self.squadron_configs.append(squadron_config)
         self.addWidget(squadron_config)
         self.parking_tracker.add_squadron(squadron)
@@ -508,6 +673,8 @@ def __init__(
         coalition: Coalition,
         squadrons: list[Squadron],
         parking_tracker: AirWingConfigParkingTracker,
+        bases: list[ControlPoint],
+        compatible_bases: dict[AircraftType, list[ControlPoint]],
         aircraft_present: bool,
     ) -> None:
         super().__init__()
@@ -515,7 +682,13 @@ def __init__(
         self.setLayout(layout)
 
         self.squadrons_config = SquadronConfigurationLayout(
-            game, coalition, squadrons, parking_tracker, aircraft_present
+            game,
+            coalition,
+            squadrons,
+            parking_tracker,
+            bases,
+            compatible_bases,
+            aircraft_present,
         )
         self.squadrons_config.config_changed.connect(self.on_squadron_config_changed)
 
@@ -550,47 +723,97 @@ def __init__(
         game: Game,
         coalition: Coalition,
         parking_tracker: AirWingConfigParkingTracker,
+        bases: list[ControlPoint],
+        compatible_bases: dict[AircraftType, list[ControlPoint]],
         aircraft_present: bool,
     ) -> None:
         super().__init__()
         self.game = game
         self.coalition = coalition
         self.parking_tracker = parking_tracker
-        self.squadrons_pages: dict[AircraftType, AircraftSquadronsPage] = {}
+        self.bases = bases
+        self.compatible_bases = compatible_bases
+        # Pages are only built the first time they are shown. Until then each type is
+        # represented by an empty placeholder widget and its squadrons are kept in
+        # pending. The parking tracker is populated from the whole air wing up front,
+        # so unbuilt pages still count towards the parking allocation.
+        self.squadrons_pages: dict[AircraftType, QWidget] = {}
+        self.pending: dict[AircraftType, list[Squadron]] = {}
         self.aircraft_present = aircraft_present
-        for aircraft, squadrons in self.air_wing.squadrons.items():
-            self.new_page_for_type(aircraft, squadrons)
+        self.add_placeholder_pages()
 
     @property
     def air_wing(self) -> AirWing:
         return self.coalition.air_wing
 
+    def add_placeholder_pages(self) -> None:
+        for aircraft, squadrons in self.air_wing.squadrons.items():
+            placeholder = QWidget()
+            self.addWidget(placeholder)
+            self.squadrons_pages[aircraft] = placeholder
+            self.pending[aircraft] = list(squadrons)
+        if self.count():
+            self.setCurrentIndex(0)
+
+    def setCurrentIndex(self, index: int) -> None:
+        self.build_pending_page(index)
+        super().setCurrentIndex(index)
+
+    def build_pending_page(self, index: int) -> None:
+        if index < 0 or index >= self.count():
+            return
+        placeholder = self.widget(index)
+        for aircraft, page in self.squadrons_pages.items():
+            if page is placeholder:
+                break
+        else:
+            return
+        squadrons = self.pending.pop(aircraft, None)
+        if squadrons is None:
+            return
+        page = self.create_page(squadrons)
+        self.insertWidget(index, page)
+        self.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.squadrons_pages[aircraft] = page
+
     def remove_page_for_type(self, aircraft_type: AircraftType):
         page = self.squadrons_pages[aircraft_type]
         self.removeWidget(page)
         page.deleteLater()
         self.squadrons_pages.pop(aircraft_type)
+        self.pending.pop(aircraft_type, None)
         self.page_removed.emit(aircraft_type)
         self.update()
 
-    def new_page_for_type(
-        self, aircraft_type: AircraftType, squadrons: list[Squadron]
-    ) -> None:
+    def create_page(self, squadrons: list[Squadron]) -> AircraftSquadronsPage:
         page = AircraftSquadronsPage(
             self.game,
             self.coalition,
             squadrons,
             self.parking_tracker,
+            self.bases,
+            self.compatible_bases,
             self.aircraft_present,
         )
         page.remove_squadron_page.connect(self.remove_page_for_type)
+        return page
+
+    def new_page_for_type(
+        self, aircraft_type: AircraftType, squadrons: list[Squadron]
+    ) -> None:
+        page = self.create_page(squadrons)
         self.addWidget(page)
         self.squadrons_pages[aircraft_type] = page
 
     def add_squadron_to_panel(self, squadron: Squadron):
         # Find existing page or add new one
-        if squadron.aircraft in self.squadrons_pages:
+        if squadron.aircraft in self.pending:
+            self.pending[squadron.aircraft].append(squadron)
+            self.parking_tracker.add_squadron(squadron)
+        elif squadron.aircraft in self.squadrons_pages:
             page = self.squadrons_pages[squadron.aircraft]
+            assert isinstance(page, AircraftSquadronsPage)
             page.add_squadron_to_page(squadron)
         else:
             self.new_page_for_type(squadron.aircraft, [squadron])
@@ -600,14 +823,28 @@ def add_squadron_to_panel(self, squadron: Squadron):
     def apply(self) -> None:
         self.air_wing.squadrons = {}
         for aircraft, page in self.squadrons_pages.items():
-            self.air_wing.squadrons[aircraft] = page.apply()
+            if aircraft in self.pending:
+                self.air_wing.squadrons[aircraft] = self.pending[aircraft]
+            else:
+                assert isinstance(page, AircraftSquadronsPage)
+                self.air_wing.squadrons[aircraft] = page.apply()
 
     def revert(self) -> None:
-        for _, page in self.squadrons_pages.items():
-            self.removeWidget(page)
-        self.squadrons_pages: dict[AircraftType, AircraftSquadronsPage] = {}
-        for aircraft, squadrons in self.air_wing.squadrons.items():
-            self.new_page_for_type(aircraft, squadrons)
+        parent = self.parentWidget()
+        if parent is not None:
+            parent.setUpdatesEnabled(False)
+        try:
+            for page in self.squadrons_pages.values():
+                self.removeWidget(page)
+                # The discarded pages would otherwise stay alive and keep refreshing
+                # their parking labels on every allocation change.
+                page.deleteLater()
+            self.squadrons_pages = {}
+            self.pending = {}
+            self.add_placeholder_pages()
+        finally:
+            if parent is not None:
+                parent.setUpdatesEnabled(True)
         self.update()
 
 
@@ -622,27 +859,46 @@ def __init__(self, air_wing: AirWing) -> None:
 
         self.item_model = QStandardItemModel(self)
         self.setModel(self.item_model)
+        self.items_by_type: dict[AircraftType, QStandardItem] = {}
 
         self.selectionModel().setCurrentIndex(
             self.item_model.index(0, 0), QItemSelectionModel.SelectionFlag.Select
         )
         self.selectionModel().selectionChanged.connect(self.on_selection_changed)
-        for aircraft in air_wing.squadrons:
-            self.add_aircraft_type(aircraft)
+        self.populate()
+
+    def has_aircraft_type(self, aircraft: AircraftType) -> bool:
+        return aircraft in self.items_by_type
 
     def remove_aircraft_type(self, aircraft: AircraftType):
-        for item in self.item_model.findItems(aircraft.display_name):
+        if (item := self.items_by_type.pop(aircraft, None)) is not None:
             self.item_model.removeRow(item.row())
         self.page_index_changed.emit(self.selectionModel().currentIndex().row())
 
     def add_aircraft_type(self, aircraft: AircraftType):
+        aircraft_item = self.item_for(aircraft)
+        self.item_model.appendRow(aircraft_item)
+        self.items_by_type[aircraft] = aircraft_item
+
+    def populate(self) -> None:
+        """Adds an item for every aircraft type in the air wing.
+
+        The items are inserted as a single batch so the view only lays out once.
+        """
+        for aircraft in self.air_wing.squadrons:
+            self.items_by_type[aircraft] = self.item_for(aircraft)
+        self.item_model.invisibleRootItem().appendRows(
+            list(self.items_by_type.values())
+        )
+
+    def item_for(self, aircraft: AircraftType) -> QStandardItem:
         aircraft_item = QStandardItem(aircraft.display_name)
         icon = self.icon_for(aircraft)
         if icon is not None:
             aircraft_item.setIcon(icon)
         aircraft_item.setEditable(False)
         aircraft_item.setSelectable(True)
-        self.item_model.appendRow(aircraft_item)
+        return aircraft_item
 
     def on_selection_changed(
         self, selected: QItemSelection, _deselected: QItemSelection
@@ -663,9 +919,13 @@ def icon_for(aircraft: AircraftType) -> Optional[QIcon]:
         return None
 
     def revert(self) -> None:
-        self.item_model.clear()
-        for aircraft in self.air_wing.squadrons:
-            self.add_aircraft_type(aircraft)
+        self.setUpdatesEnabled(False)
+        try:
+            self.item_model.clear()
+            self.items_by_type.clear()
+            self.populate()
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 class AirWingConfigurationTab(QWidget):
@@ -678,9 +938,15 @@ def __init__(
         self.setLayout(layout)
         self.game = game
         self.coalition = coalition
+        # Taken before any squadron box claims its player pilots.
+        self.initialized_state = self.air_wing_state()
         self.parking_tracker = AirWingConfigParkingTracker(
             coalition.air_wing.iter_squadrons()
         )
+        # Shared by every base selector in the tab since they all list the bases of
+        # this coalition.
+        self.bases = list(game.theater.control_points_for(coalition.player))
+        self.compatible_bases: dict[AircraftType, list[ControlPoint]] = {}
 
         self.type_list = AircraftTypeList(coalition.air_wing)
 
@@ -691,13 +957,31 @@ def __init__(
         layout.addWidget(add_button, 2, 1, 1, 1)
 
         self.squadrons_panel = AircraftSquadronsPanel(
-            game, coalition, self.parking_tracker, aircraft_present
+            game,
+            coalition,
+            self.parking_tracker,
+            self.bases,
+            self.compatible_bases,
+            aircraft_present,
         )
         self.squadrons_panel.page_removed.connect(self.type_list.remove_aircraft_type)
         layout.addLayout(self.squadrons_panel, 1, 3, 2, 1)
 
         self.type_list.page_index_changed.connect(self.squadrons_panel.setCurrentIndex)
 
+    @cached_property
+    def possible_aircraft(self) -> set[AircraftType]:
+        """All aircraft of the faction that can operate from the coalition's bases.
+
+        Neither the faction nor the bases change while the dialog is open.
+        """
+        return {
+            aircraft
+            for aircraft in self.coalition.faction.all_aircrafts
+            if isinstance(aircraft, AircraftType)
+            and any(base.can_operate(aircraft) for base in self.bases)
+        }
+
     def add_squadron(self) -> None:
         selected_aircraft = None
         if self.type_list.selectionModel().currentIndex().row() >= 0:
@@ -705,21 +989,12 @@ def add_squadron(self) -> None:
                 self.type_list.selectionModel().currentIndex().row()
             ).text()
 
-        bases = list(self.game.theater.control_points_for(self.coalition.player))
-
-        # List of all Aircrafts possible to operate with the given bases
-        possible_aircrafts = {
-            aircraft
-            for aircraft in self.coalition.faction.all_aircrafts
-            if isinstance(aircraft, AircraftType)
-            and any(base.can_operate(aircraft) for base in bases)
-        }
-
         popup = SquadronConfigPopup(
             selected_aircraft,
-            possible_aircrafts,
-            bases,
+            self.possible_aircraft,
+            self.bases,
             self.coalition.air_wing.squadron_defs,
+            self.compatible_bases,
         )
         if popup.exec_() != QDialog.DialogCode.Accepted:
             return
@@ -747,7 +1022,7 @@ def add_squadron(self) -> None:
         )
 
         # Add Squadron
-        if not self.type_list.item_model.findItems(selected_type.display_name):
+        if not self.type_list.has_aircraft_type(selected_type):
             self.type_list.add_aircraft_type(selected_type)
             # TODO Select the newly added type
         self.squadrons_panel.add_squadron_to_panel(squadron)
@@ -761,6 +1036,33 @@ def revert(self) -> None:
         self.squadrons_panel.revert()
         self.update()
 
+    def air_wing_state(self) -> list[tuple[Any, ...]]:
+        """Returns the parts of the air wing that the configuration can change."""
+        return [
+            (
+                id(squadron),
+                squadron.name,
+                squadron.nickname,
+                squadron.max_size,
+                squadron.primary_task,
+                squadron.location,
+                frozenset(squadron.auto_assignable_mission_types),
+                tuple((p.name, p.player) for p in squadron.pilot_pool),
+            )
+            for squadron in self.coalition.air_wing.iter_squadrons()
+        ]
+
+    def initialize_turn_if_changed(self) -> None:
+        """Re-initializes the coalition's turn if the air wing changed.
+
+        Turn initialization replans the coalition's ATO, so it is skipped when the
+        configuration was accepted without any changes.
+        """
+        state = self.air_wing_state()
+        if self.coalition.game.turn != 0 and state != self.initialized_state:
+            self.coalition.initialize_turn(False)
+        self.initialized_state = state
+
 
 class AirWingConfigurationDialog(QDialog):
     """Dialog window for air wing configuration."""
@@ -770,6 +1072,7 @@ def __init__(self, game: Game, aircraft_present: bool, parent) -> None:
         self.setMinimumSize(1024, 768)
         self.setWindowTitle(f"Air Wing Configuration")
         # TODO: self.setWindowIcon()
+        self.file_task: Optional[AirWingFileTask] = None
 
         layout = QVBoxLayout()
         self.setLayout(layout)
@@ -838,40 +1141,80 @@ def save_config(self) -> None:
                 tab.apply()
             airwing = self._build_air_wing()
             filename = fd.selectedFiles()[0]
-            with open(filename, "w") as f:
-                f.write(yaml.dump(airwing))
+
+            def save() -> None:
+                with open(
+                    filename,
+                    "w",
+                    buffering=AIR_WING_FILE_BUFFER_SIZE,
+                    encoding="utf-8",
+                ) as f:
+                    # Keep the fields in the order they are built rather than paying
+                    # for a sort, and write the short lists inline.
+                    yaml.dump(
+                        airwing,
+                        f,
+                        Dumper=SafeDumper,
+                        sort_keys=False,
+                        default_flow_style=None,
+                    )
+
+            self._start_file_task(save, lambda _: None)
+
+    def _start_file_task(
+        self, task: Callable[[], Any], on_finished: Callable[[Any], None]
+    ) -> None:
+        # The dialog is disabled until the file has been processed so that the air
+        # wing can't be edited while it is being saved or replaced.
+        self.setEnabled(False)
+        self.setCursor(Qt.CursorShape.WaitCursor)
+        file_task = AirWingFileTask(task)
+        file_task.signals.finished.connect(self._on_file_task_done)
+        file_task.signals.finished.connect(on_finished)
+        file_task.signals.failed.connect(self._on_file_task_failed)
+        # Keep a reference so the signals outlive the runnable, which the pool deletes
+        # once it has run.
+        self.file_task = file_task
+        QThreadPool.globalInstance().start(file_task)
+
+    def _on_file_task_done(self, _result: Any) -> None:
+        self.file_task = None
+        self.unsetCursor()
+        self.setEnabled(True)
+
+    def _on_file_task_failed(self, message: str) -> None:
+        self._on_file_task_done(None)
+        QMessageBox.critical(
+            self, "Air Wing Config", message, QMessageBox.StandardButton.Ok
+        )
 
     def _build_air_wing(self) -> dict:
         w = self.tab_widget.currentWidget()
         assert isinstance(w, AirWingConfigurationTab)
-        squadrons = {}
-        for ac, sqs in w.coalition.air_wing.squadrons.items():
+        air_wing = w.coalition.air_wing
+        squadron_defs = air_wing.squadron_defs
+        squadrons: dict[Any, list[dict[str, Any]]] = {}
+        for ac, sqs in air_wing.squadrons.items():
+            defined_names = {x.name for x in squadron_defs.get(ac, [])}
             for s in sqs:
                 cp = s.location.at
                 if isinstance(cp, Point):
                     key = s.location.full_name
                 else:
                     key = cp.id
-                name = (
-                    s.name
-                    if s.name
-                    in [x.name for x in w.coalition.air_wing.squadron_defs[ac]]
-                    else s.aircraft.variant_id
-                )
+                name = s.name if s.name in defined_names else s.aircraft.variant_id
+                primary = s.primary_task.value
                 entry = {
-                    "primary": s.primary_task.value,
+                    "primary": primary,
                     "secondary": [
                         sec.value
                         for sec in s.auto_assignable_mission_types
-                        if sec.value != s.primary_task.value
+                        if sec.value != primary
                     ],
                     "aircraft": [name],
                     "size": s.max_size,
                 }
-                if squadrons.get(key):
-                    squadrons[key].append(entry)
-                else:
-                    squadrons[key] = [entry]
+                squadrons.setdefault(key, []).append(entry)
         return squadrons
 
     def load_config(self) -> None:
@@ -892,21 +1235,66 @@ def load_config(self) -> None:
         )
         if fd.exec_():
             filename = fd.selectedFiles()[0]
-            with open(filename, "r") as f:
-                airwing = yaml.safe_load(f)
-                self._construct_air_wing_tab(airwing)
+            w = self.tab_widget.currentWidget()
+            assert isinstance(w, AirWingConfigurationTab)
+            theater = w.coalition.game.theater
+
+            def load() -> tuple[dict[str, Any], CampaignAirWingConfig]:
+                # Hand libyaml the whole file at once rather than having it call back
+                # into Python to read each chunk. It detects the encoding itself.
+                with open(filename, "rb") as f:
+                    airwing = yaml.load(f.read(), Loader=SafeLoader)
+                # Resolving the bases only reads the theater, so it can be done here
+                # too. Creating the squadrons has to wait for the UI thread.
+                return airwing, CampaignAirWingConfig.from_campaign_data(
+                    airwing, theater
+                )
+
+            self._start_file_task(
+                load, lambda result: self._construct_air_wing_tab(*result)
+            )
 
-    def _construct_air_wing_tab(self, airwing: dict[str, Any]) -> None:
+    def _construct_air_wing_tab(
+        self, airwing: dict[str, Any], config: CampaignAirWingConfig
+    ) -> None:
         w = self.tab_widget.currentWidget()
         assert isinstance(w, AirWingConfigurationTab)
         c = w.coalition
+        if isinstance(airwing, dict) and self._comparable_air_wing(
+            airwing
+        ) == self._comparable_air_wing(self._build_air_wing()):
+            # The file describes the air wing as it is, so keep the existing squadrons
+            # (and the ATO) rather than recreating them. Only discard the edits that
+            # haven't been applied yet.
+            w.revert()
+            return
         c.air_wing.squadrons = defaultdict(list)
-        config = CampaignAirWingConfig.from_campaign_data(airwing, c.game.theater)
         c.configure_default_air_wing(config)
+        # Taken before the rebuilt squadron boxes claim their player pilots.
+        w.initialized_state = w.air_wing_state()
         w.revert()
         if c.game.turn != 0:
             c.initialize_turn(False)
 
+    @staticmethod
+    def _comparable_air_wing(airwing: dict[Any, Any]) -> dict[Any, Any]:
+        # The order of the secondary tasks is arbitrary, so compare them sorted.
+        # Anything not in the shape written by save_config is compared as is.
+        comparable = {}
+        for key, entries in airwing.items():
+            if isinstance(entries, list):
+                entries = [
+                    (
+                        {**entry, "secondary": sorted(map(str, entry["secondary"]))}
+                        if isinstance(entry, dict)
+                        and isinstance(entry.get("secondary"), list)
+                        else entry
+                    )
+                    for entry in entries
+                ]
+            comparable[key] = entries
+        return comparable
+
     def revert(self) -> None:
         for tab in self.tabs:
             tab.revert()
@@ -914,8 +1302,7 @@ def revert(self) -> None:
     def accept(self) -> None:
         for tab in self.tabs:
             tab.apply()
-            if tab.coalition.game.turn != 0:
-                tab.coalition.initialize_turn(False)
+            tab.initialize_turn_if_changed()
         super().accept()
 
     def reject(self) -> None:
@@ -938,8 +1325,12 @@ def __init__(
         super().__init__()
         self.setSizeAdjustPolicy(QComboBox.SizeAdjustPolicy.AdjustToContents)
 
-        for type in sorted(types, key=lambda type: type.display_name):
-            self.addItem(type.display_name, type)
+        self.setUpdatesEnabled(False)
+        try:
+            for type in sorted(types, key=attrgetter("display_name")):
+                self.addItem(type.display_name, type)
+        finally:
+            self.setUpdatesEnabled(True)
 
         if selected_aircraft:
             self.setCurrentText(selected_aircraft)
@@ -959,19 +1350,24 @@ def __init__(
         self.set_aircraft_type(aircraft)
 
     def set_aircraft_type(self, aircraft: Optional[AircraftType]):
-        self.clear()
-        if self.allow_random:
-            self.addItem("None (Random)", None)
-        if aircraft and aircraft in self.squadron_defs:
-            for squadron_def in sorted(
-                self.squadron_defs[aircraft], key=lambda squadron_def: squadron_def.name
-            ):
-                if not squadron_def.claimed:
-                    squadron_name = squadron_def.name
-                    if squadron_def.nickname:
-                        squadron_name += " (" + squadron_def.nickname + ")"
+        self.setUpdatesEnabled(False)
+        try:
+            self.clear()
+            if self.allow_random:
+                self.addItem("None (Random)", None)
+            if aircraft and aircraft in self.squadron_defs:
+                unclaimed = [d for d in self.squadron_defs[aircraft] if not d.claimed]
+                unclaimed.sort(key=attrgetter("name"))
+                for squadron_def in unclaimed:
+                    squadron_name = (
+                        f"{squadron_def.name} ({squadron_def.nickname})"
+                        if squadron_def.nickname
+                        else squadron_def.name
+                    )
                     self.addItem(squadron_name, squadron_def)
-        self.setCurrentIndex(0)
+            self.setCurrentIndex(0)
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 class SquadronConfigPopup(QDialog):
@@ -981,6 +1377,7 @@ def __init__(
         types: set[AircraftType],
         bases: list[ControlPoint],
         squadron_defs: dict[AircraftType, list[SquadronDef]],
+        compatible_bases: Optional[dict[AircraftType, list[ControlPoint]]] = None,
     ) -> None:
         super().__init__()
 
@@ -997,23 +1394,20 @@ def __init__(
             self.on_aircraft_selection
         )
         self.column.addWidget(self.aircraft_type_selector)
+        aircraft = self.aircraft_type_selector.currentData()
 
         self.column.addWidget(QLabel("Primary task:"))
-        self.primary_task_selector = PrimaryTaskSelector(
-            self.aircraft_type_selector.currentData()
-        )
+        self.primary_task_selector = PrimaryTaskSelector(aircraft)
         self.column.addWidget(self.primary_task_selector)
 
         self.column.addWidget(QLabel("Base:"))
         self.squadron_base_selector = SquadronBaseSelector(
-            bases, None, self.aircraft_type_selector.currentData()
+            bases, None, aircraft, compatible_bases
         )
         self.column.addWidget(self.squadron_base_selector)
 
         self.column.addWidget(QLabel("Preset:"))
-        self.squadron_def_selector = SquadronDefSelector(
-            squadron_defs, self.aircraft_type_selector.currentData()
-        )
+        self.squadron_def_selector = SquadronDefSelector(squadron_defs, aircraft)
         self.column.addWidget(self.squadron_def_selector)
 
         self.column.addStretch()
@@ -1039,15 +1433,10 @@ def update_accept_button(self) -> None:
         self.accept_button.setEnabled(enabled)
 
     def on_aircraft_selection(self) -> None:
-        self.squadron_base_selector.set_aircraft_type(
-            self.aircraft_type_selector.currentData()
-        )
-        self.squadron_def_selector.set_aircraft_type(
-            self.aircraft_type_selector.currentData()
-        )
-        self.primary_task_selector.set_aircraft(
-            self.aircraft_type_selector.currentData()
-        )
+        aircraft = self.aircraft_type_selector.currentData()
+        self.squadron_base_selector.set_aircraft_type(aircraft)
+        self.squadron_def_selector.set_aircraft_type(aircraft)
+        self.primary_task_selector.set_aircraft(aircraft)
         self.update_accept_button()
         self.update()
 
@@ -261,7 +261,8 @@ def __init__(self, game_model: GameModel) -> None:
             ),
             "Squadrons OPFOR",
         )
-        self.addTab(AirInventoryView(game_model), "Inventory")
+        self.inventory = AirInventoryView(game_model)
+        self.addTab(self.inventory, "Inventory")
 
         if game_model.game.settings.enable_air_wing_adjustments:
             pb = QPushButton("Open Air Wing Config Dialog")
@@ -323,4 +324,9 @@ def __init__(self, game_model: GameModel, parent) -> None:
         layout = QVBoxLayout()
         self.setLayout(layout)
 
-        layout.addWidget(AirWingTabs(game_model))
+        self.tabs = AirWingTabs(game_model)
+        layout.addWidget(self.tabs)
+
+    def refresh(self) -> None:
+        """Updates the parts of the dialog that aren't backed by a live model."""
+        self.tabs.inventory.update_table()
@@ -107,6 +107,13 @@ def __init__(self, game_model: GameModel, parent=None) -> None:
         )
         button_layout.addWidget(self.cancel_button)
 
+    def refresh(self) -> None:
+        """Updates the dialog after the game has been updated."""
+        self.transfer_model.refresh()
+        self.cancel_button.setEnabled(
+            self.can_cancel(self.transfer_list.currentIndex())
+        )
+
     def on_cancel_transfer(self) -> None:
         """Cancels the selected transfer order."""
         self.transfer_model.cancel_transfer_at_index(self.transfer_list.currentIndex())
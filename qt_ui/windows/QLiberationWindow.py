@@ -1,12 +1,29 @@
 import logging
+import shutil
 import traceback
 import webbrowser
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QSettings, Qt, Signal
-from PySide6.QtGui import QCloseEvent, QIcon, QAction, QGuiApplication, QActionGroup
+from PySide6.QtCore import (
+    QObject,
+    QRunnable,
+    QSettings,
+    QThreadPool,
+    Qt,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import (
+    QAction,
+    QActionGroup,
+    QCloseEvent,
+    QGuiApplication,
+    QIcon,
+    QShowEvent,
+)
 from PySide6.QtWidgets import (
     QApplication,
     QFileDialog,
@@ -23,7 +40,6 @@
 from game.game import TurnState
 from game.layout import LAYOUTS
 from game.persistency import pre_pretense_backups_dir
-from game.pretense.pretensemissiongenerator import PretenseMissionGenerator
 from game.server import EventStream, GameContext
 from game.server.dependencies import QtCallbacks, QtContext
 from game.theater import ControlPoint, MissionTarget, TheaterGroundObject
@@ -38,18 +54,137 @@
 from qt_ui.widgets.ato import QAirTaskingOrderPanel
 from qt_ui.widgets.map.QLiberationMap import QLiberationMap
 from qt_ui.windows.GameUpdateSignal import GameUpdateSignal
-from qt_ui.windows.QDebriefingWindow import QDebriefingWindow
-from qt_ui.windows.basemenu.QBaseMenu2 import QBaseMenu2
-from qt_ui.windows.groundobject.QGroundObjectMenu import QGroundObjectMenu
 from qt_ui.windows.infos.QInfoPanel import QInfoPanel
-from qt_ui.windows.logs.QLogsWindow import QLogsWindow
-from qt_ui.windows.newgame.QNewGameWizard import NewGameWizard
-from qt_ui.windows.notes.QNotesWindow import QNotesWindow
-from qt_ui.windows.preferences.QLiberationPreferencesWindow import (
-    QLiberationPreferencesWindow,
+
+
+WINDOW_TITLE = f"DCS Retribution - v{VERSION}"
+
+SAVE_FILE_FILTER = "*.retribution;;*.liberation"
+
+END_GAME_MESSAGES = {
+    TurnState.WIN: (
+        "Victory!",
+        "You have won the campaign, do you wish to start a new one?",
+    ),
+    TurnState.LOSS: (
+        "Defeat!",
+        "You have lost the campaign, do you wish to start a new one?",
+    ),
+}
+
+CONTRIBUTORS = [
+    "shdwp",
+    "Khopa",
+    "ColonelPanic",
+    "RndName",
+    "Roach",
+    "Malakhit",
+    "Wrycu",
+    "calvinmorrow",
+    "JohanAberg",
+    "Deus",
+    "SiKruger",
+    "Mustang-25",
+    "bgreman",
+    "magwo",
+    "SnappyComebacks",
+    "kavinsky",
+    "Schneefl0cke",
+    "pbzweihander",
+    "Raskil",
+    "nosv1",
+    "jake-lewis",
+    "teamMOYA",
+    "benedikt-wegmann",
+    "movq",
+    "bbirchnz",
+    "eddiwood",
+    "root0fall",
+    "calvinmorrow",
+    "UKayeF",
+    "Captain Cody",
+    "steveveepee",
+    "pedromagueija",
+    "parithon",
+    "TheCandianVendingMachine",
+    "bwRavencl",
+    "davidp57",
+    "Plob",
+    "Hawkmoon",
+    "alrik11es",
+    "Starfire13",
+    "Hornet2041/Lion",
+    "SgtFuzzle17",
+    "Doc_of_Mur",
+    "NickJZX",
+    "Sith1144",
+    "Raffson",
+    "MetalStormGhost",
+    "HolyOrangeJuice (WRL)",
+    "Adecarcer",
+    "pande4360",
+    "zhexu14",
+    "ColonelAkirNakesh",
+    "Nosajthedevil",
+    "kivipe",
+    "Turbolious",
+    "ingax01",
+    "M-Chimiste",
+    "tmz42",
+]
+
+ABOUT_TEXT = (
+    "<h3>DCS Retribution " + VERSION + "</h3>" + "<b>Source code : </b>"
+    "<a href='https://github.com/dcs-retribution/dcs-retribution' style='color:white'>"
+    "https://github.com/dcs-retribution/dcs-retribution </a>"
+    + "<h4>Authors</h4>"
+    + "<p>DCS Retribution is an (independent) fork of DCS Liberation, "
+    "which was originally developed by <b>shdwp</b>. "
+    "DCS Liberation 2.0 is a partial rewrite based on this work by <b>Khopa</b>. "
+    "DCS Retribution was forked during development of "
+    "DCS Liberation v6.0.0 in 2022 by <b>Raffson</> & <b>MetalStormGhost</>."
+    "<h4>Contributors</h4>" + ", ".join(CONTRIBUTORS) + "<h4>Special Thanks  :</h4>"
+    "<b>rp-</b> <i>for the pydcs framework</i><br/>"
+    "<b>Grimes (mrSkortch)</b> & <b>Speed</b> <i>for the MIST framework</i><br/>"
+    "<b>Ciribob </b> <i>for the JTACAutoLase.lua script</i><br/>"
+    "<b>Walder </b> <i>for the Skynet-IADS script</i><br/>"
+    "<b>Anubis Yinepu </b> <i>for the Hercules Cargo script</i><br/>"
+    '<a href="https://www.flaticon.com/free-icons/bug" title="bug icons" style="color: #ffffff">Bug icons created by Freepik - Flaticon</a><br />'
+    'Contains information from <a href="https://osmdata.openstreetmap.de/" style="color: #ffffff">OpenStreetMap © OpenStreetMap contributors</a>, which is made available here under the <a href="https://opendatacommons.org/licenses/odbl/1-0/" style="color: #ffffff">Open Database License (ODbL)</a>.<br />'
+    '<a href="https://download.geofabrik.de/index.html/" style="color: #ffffff">OpenStreetMap Data Extracts from Geofabrik</a><br />'
+    '<a href="https://www.earthdata.nasa.gov/" style="color: #ffffff">NASA EarthData</a><br />'
+    + "<h4>Splash Screen  :</h4>"
+    + "Artwork by Andriy Dankovych (CC BY-SA)"
+    " <a href='https://www.facebook.com/AndriyDankovych' style='color:white'>"
+    "[https://www.facebook.com/AndriyDankovych]</a>"
 )
-from qt_ui.windows.settings.QSettingsWindow import QSettingsWindow
-from qt_ui.windows.stats.QStatsWindow import QStatsWindow
+
+
+class LoadGameSignals(QObject):
+    loaded = Signal(object, str)
+
+
+class LoadGameTask(QRunnable):
+    """Loads a save game on the global thread pool.
+
+    The loaded game (or None if it could not be loaded) and its path are delivered by
+    the loaded signal, which is received on the UI thread.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+        self.signals = LoadGameSignals()
+
+    def run(self) -> None:
+        game: Optional[Game] = None
+        try:
+            game = persistency.load_game(self.path)
+        except Exception:
+            # The UI thread is waiting for the signal, so errors such as a missing file
+            # must not escape the worker.
+            logging.exception(f"Could not load {self.path}")
+        self.signals.loaded.emit(game, self.path)
 
 
 class QLiberationWindow(QMainWindow):
@@ -61,30 +196,50 @@ def __init__(self, game: Game | None, ui_flags: UiFlags) -> None:
         super().__init__()
 
         self._uncaught_exception_handler = UncaughtExceptionHandler(self)
+        self._settings: Optional[QSettings] = None
+        self.about_dialog: Optional[QMessageBox] = None
+        self.load_game_task: Optional[LoadGameTask] = None
 
         self.game = game
         self.sim_controller = SimController(self.game)
-        self.sim_controller.sim_update.connect(EventStream.put_nowait)
+        # Emitted from the game loop timer thread. EventStream's queue is not thread
+        # safe, so updates must be queued to the GUI thread like the other callers.
+        self.sim_controller.sim_update.connect(
+            EventStream.put_nowait,
+            Qt.ConnectionType.QueuedConnection,  # type: ignore[arg-type]
+        )
         self.game_model = GameModel(game, self.sim_controller)
         GameContext.set_model(self.game_model)
+        # These are emitted by the web server's threads and open dialogs, so they must
+        # be delivered on the GUI thread.
         self.new_package_signal.connect(
-            lambda target: Dialog.open_new_package_dialog(target, self)
+            lambda target: Dialog.open_new_package_dialog(target, self),
+            Qt.ConnectionType.QueuedConnection,  # type: ignore[arg-type]
+        )
+        self.tgo_info_signal.connect(
+            self.open_tgo_info_dialog,
+            Qt.ConnectionType.QueuedConnection,  # type: ignore[arg-type]
+        )
+        self.control_point_info_signal.connect(
+            self.open_control_point_info_dialog,
+            Qt.ConnectionType.QueuedConnection,  # type: ignore[arg-type]
         )
-        self.tgo_info_signal.connect(self.open_tgo_info_dialog)
-        self.control_point_info_signal.connect(self.open_control_point_info_dialog)
         QtContext.set_callbacks(
             QtCallbacks(
-                lambda target: self.new_package_signal.emit(target),
-                lambda tgo: self.tgo_info_signal.emit(tgo),
-                lambda cp: self.control_point_info_signal.emit(cp),
+                self.new_package_signal.emit,
+                self.tgo_info_signal.emit,
+                self.control_point_info_signal.emit,
             )
         )
         Dialog.set_game(self.game_model)
         self.ato_panel = QAirTaskingOrderPanel(self.game_model)
         self.info_panel = QInfoPanel(self.game)
-        self.liberation_map = QLiberationMap(
-            self.game_model, ui_flags.dev_ui_webserver, self
-        )
+        # The web map is the most expensive widget to create, so it is only built once
+        # the window has been shown. The placeholder reserves its space until then.
+        self.dev_ui_webserver = ui_flags.dev_ui_webserver
+        self.liberation_map: Optional[QLiberationMap] = None
+        self.map_placeholder = QWidget()
+        self.map_placeholder.setMinimumSize(800, 600)
 
         self.setGeometry(300, 100, 270, 100)
         self.updateWindowTitle()
@@ -103,49 +258,96 @@ def __init__(self, game: Game | None, ui_flags: UiFlags) -> None:
         self.setGeometry(0, 0, screen.width(), screen.height())
         self.setWindowState(Qt.WindowState.WindowMaximized)
 
-        # But override it with the saved configuration if it exists.
+        # But override it with the saved configuration if it exists. This is restored
+        # before the window is shown so that it doesn't visibly jump.
         self._restore_window_geometry()
 
-        if self.game is None:
-            last_save_file = liberation_install.get_last_save_file()
-            if last_save_file:
-                logging.info("Loading last saved game : " + str(last_save_file))
-                game = persistency.load_game(last_save_file)
-                game = self.migrate_game(game, last_save_file)
-                self.onGameGenerated(game)
-                self.updateWindowTitle(last_save_file if game else None)
-            else:
-                logging.info("No existing save game")
-        else:
+        # Loading the game can take a while, so let the window show up first.
+        QTimer.singleShot(0, self.load_initial_game)
+
+    def load_initial_game(self) -> None:
+        if self.game is not None:
             self.onGameGenerated(self.game)
+            return
+
+        last_save_file = liberation_install.get_last_save_file()
+        if not last_save_file:
+            logging.info("No existing save game")
+            return
+
+        logging.info("Loading last saved game : " + str(last_save_file))
+        self.load_game_file(last_save_file)
+
+    def load_game_file(self, path: str) -> None:
+        """Loads the save game at path in the background."""
+        if self.load_game_task is not None:
+            return
+        self.statusBar().showMessage(f"Loading {path}...")
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        # Opening or creating another game while this one loads would race with it.
+        self.openAction.setEnabled(False)
+        self.newGameAction.setEnabled(False)
+        task = LoadGameTask(path)
+        task.signals.loaded.connect(self.on_game_loaded)
+        # Keep a reference so the signals outlive the runnable, which the pool deletes
+        # once it has run.
+        self.load_game_task = task
+        QThreadPool.globalInstance().start(task)
+
+    def on_game_loaded(self, game: Optional[Game], path: str) -> None:
+        self.load_game_task = None
+        QApplication.restoreOverrideCursor()
+        self.statusBar().showMessage("Ready")
+        self.openAction.setEnabled(True)
+        self.newGameAction.setEnabled(True)
+        game = self.migrate_game(game, path)
+        self.onGameGenerated(game, path if game else None)
 
     def initUi(self, ui_flags: UiFlags) -> None:
         hbox = QSplitter(Qt.Orientation.Horizontal)
-        vbox = QSplitter(Qt.Orientation.Vertical)
+        self.map_splitter = QSplitter(Qt.Orientation.Vertical)
         hbox.addWidget(self.ato_panel)
-        hbox.addWidget(vbox)
-        vbox.addWidget(self.liberation_map)
-        vbox.addWidget(self.info_panel)
+        hbox.addWidget(self.map_splitter)
+        self.map_splitter.addWidget(self.map_placeholder)
+        self.map_splitter.addWidget(self.info_panel)
 
         # Will make the ATO sidebar as small as necessary to fit the content. In
         # practice this means it is sized by the hints in the panel.
         hbox.setSizes([1, 10000000])
-        vbox.setSizes([600, 100])
+        self.map_splitter.setSizes([600, 100])
 
         self.top_panel = QTopPanel(self.game_model, self.sim_controller, ui_flags)
-        vbox = QVBoxLayout()
-        vbox.setContentsMargins(0, 0, 0, 0)
-        vbox.addWidget(self.top_panel)
-        vbox.addWidget(hbox)
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.top_panel)
+        layout.addWidget(hbox)
 
         central_widget = QWidget()
-        central_widget.setLayout(vbox)
+        central_widget.setLayout(layout)
         self.setCentralWidget(central_widget)
 
+    def showEvent(self, event: QShowEvent) -> None:
+        super().showEvent(event)
+        if self.liberation_map is None:
+            # Let the window paint before the web view is created.
+            QTimer.singleShot(0, self.init_liberation_map)
+
+    def init_liberation_map(self) -> None:
+        if self.liberation_map is not None:
+            return
+        self.liberation_map = QLiberationMap(
+            self.game_model, self.dev_ui_webserver, self
+        )
+        self.map_splitter.replaceWidget(
+            self.map_splitter.indexOf(self.map_placeholder), self.liberation_map
+        )
+        self.map_placeholder.deleteLater()
+
     def connectSignals(self):
-        GameUpdateSignal.get_instance().gameupdated.connect(self.setGame)
-        GameUpdateSignal.get_instance().debriefingReceived.connect(self.onDebriefing)
-        GameUpdateSignal.get_instance().game_state_changed.connect(self.onEndGame)
+        signal = GameUpdateSignal.get_instance()
+        signal.gameupdated.connect(self.setGame)
+        signal.debriefingReceived.connect(self.onDebriefing)
+        signal.game_state_changed.connect(self.onEndGame)
 
     def initActions(self):
         self.newGameAction = QAction("&New Game", self)
@@ -179,28 +381,29 @@ def initActions(self):
         self.openDiscordAction = QAction("&Discord Server", self)
         self.openDiscordAction.setIcon(CONST.ICONS["Discord"])
         self.openDiscordAction.triggered.connect(
-            lambda: webbrowser.open_new_tab(
-                "https://" + "discord.gg" + "/" + "b4x34Bg" + "4We"
+            partial(
+                webbrowser.open_new_tab,
+                "https://" + "discord.gg" + "/" + "b4x34Bg" + "4We",
             )
         )
 
         self.openGithubAction = QAction("&Github Repo", self)
         self.openGithubAction.setIcon(CONST.ICONS["Github"])
         self.openGithubAction.triggered.connect(
-            lambda: webbrowser.open_new_tab(URLS["Repository"])
+            partial(webbrowser.open_new_tab, URLS["Repository"])
         )
 
         self.ukraineAction = QAction("&Ukraine", self)
         self.ukraineAction.setIcon(CONST.ICONS["Ukraine"])
         self.ukraineAction.triggered.connect(
-            lambda: webbrowser.open_new_tab("https://shdwp.github.io/ukraine/")
+            partial(webbrowser.open_new_tab, "https://shdwp.github.io/ukraine/")
         )
 
         self.pretenseLinkAction = QAction("&DCS: Pretense", self)
         self.pretenseLinkAction.setIcon(QIcon(CONST.ICONS["Pretense_discord"]))
         self.pretenseLinkAction.triggered.connect(
-            lambda: webbrowser.open_new_tab(
-                "https://" + "discord.gg" + "/" + "PtPsb9Mpk6"
+            partial(
+                webbrowser.open_new_tab, "https://" + "discord.gg" + "/" + "PtPsb9Mpk6"
             )
         )
 
@@ -281,16 +484,16 @@ def initMenuBar(self):
         help_menu.addAction(self.openGithubAction)
         help_menu.addAction(self.ukraineAction)
         help_menu.addAction(
-            "&Releases", lambda: webbrowser.open_new_tab(URLS["Releases"])
+            "&Releases", partial(webbrowser.open_new_tab, URLS["Releases"])
         )
         help_menu.addAction(
-            "&Online Manual", lambda: webbrowser.open_new_tab(URLS["Manual"])
+            "&Online Manual", partial(webbrowser.open_new_tab, URLS["Manual"])
         )
         help_menu.addAction(
-            "&ED Forum Thread", lambda: webbrowser.open_new_tab(URLS["ForumThread"])
+            "&ED Forum Thread", partial(webbrowser.open_new_tab, URLS["ForumThread"])
         )
         help_menu.addAction(
-            "Report an &issue", lambda: webbrowser.open_new_tab(URLS["Issues"])
+            "Report an &issue", partial(webbrowser.open_new_tab, URLS["Issues"])
         )
         help_menu.addAction(self.openLogsAction)
 
@@ -318,11 +521,17 @@ def closure():
         return action
 
     def newGame(self):
+        # Windows that are only opened on demand are imported when first needed to
+        # keep them off the startup path.
+        from qt_ui.windows.newgame.QNewGameWizard import NewGameWizard
+
         wizard = NewGameWizard(self)
         wizard.show()
         wizard.accepted.connect(lambda: self.onGameGenerated(wizard.generatedGame))
 
     def newPretenseCampaign(self):
+        from game.pretense.pretensemissiongenerator import PretenseMissionGenerator
+
         output = persistency.mission_path_for("pretense_campaign.miz")
         try:
             PretenseMissionGenerator(
@@ -331,36 +540,33 @@ def newPretenseCampaign(self):
         except Exception as e:
             now = datetime.now()
             date_time = now.strftime("%Y-%d-%mT%H_%M_%S")
-            path = pre_pretense_backups_dir()
-            tgt = path / f"pre-pretense-backup_{date_time}.retribution"
-            path /= f".pre-pretense-backup.retribution"
-            if path.exists():
-                with open(path, "rb") as source:
-                    with open(tgt, "wb") as target:
-                        target.write(source.read())
+            backups_dir = pre_pretense_backups_dir()
+            tgt = backups_dir / f"pre-pretense-backup_{date_time}.retribution"
+            source = backups_dir / ".pre-pretense-backup.retribution"
+            if source.exists():
+                shutil.copyfile(source, tgt)
+                logging.info(f"Backed up {source.stat().st_size} bytes to {tgt}")
             raise e
 
         title = "Pretense campaign generated"
         msg = f"A Pretense campaign mission has been successfully generated in {output}"
         QMessageBox.information(QApplication.focusWidget(), title, msg, QMessageBox.Ok)
 
-    def openFile(self):
+    def file_dialog_dir(self) -> str:
         if self.game is not None and self.game.savepath:
-            save_dir = self.game.savepath
-        else:
-            save_dir = str(persistency.save_dir())
+            return self.game.savepath
+        # Not cached: the saved games folder can be changed in the preferences.
+        return str(persistency.save_dir())
+
+    def openFile(self):
         file = QFileDialog.getOpenFileName(
             self,
             "Select game file to open",
-            dir=save_dir,
-            filter="*.retribution;;*.liberation",
+            dir=self.file_dialog_dir(),
+            filter=SAVE_FILE_FILTER,
         )
         if file is not None and file[0] != "":
-            game = persistency.load_game(file[0])
-            game = self.migrate_game(game, file[0])
-            GameUpdateSignal.get_instance().game_loaded.emit(game)
-
-            self.updateWindowTitle(file[0])
+            self.load_game_file(file[0])
 
     def migrate_game(self, game, path):
         if game:
@@ -395,17 +601,13 @@ def saveGame(self):
             self.saveGameAs()
 
     def saveGameAs(self):
-        if self.game is not None and self.game.savepath:
-            save_dir = self.game.savepath
-        else:
-            save_dir = str(persistency.save_dir())
         file = QFileDialog.getSaveFileName(
             self,
             "Save As",
-            dir=save_dir,
-            filter="*.retribution;;*.liberation",
+            dir=self.file_dialog_dir(),
+            filter=SAVE_FILE_FILTER,
         )
-        if file is not None:
+        if file is not None and file[0] != "":
             self.game.savepath = file[0]
             persistency.save_game(self.game)
             liberation_install.setup_last_save_file(self.game.savepath)
@@ -417,14 +619,13 @@ def updateWindowTitle(self, save_path: Optional[str] = None) -> None:
         """
         to DCS Retribution - vX.X.X - file_name
         """
-        window_title = f"DCS Retribution - v{VERSION}"
+        window_title = WINDOW_TITLE
         if save_path:  # appending the file name to title as it is updated
-            file_name = save_path.split("/")[-1].rsplit(".", 1)[0]
-            window_title = f"{window_title} - {file_name}"
+            window_title = f"{window_title} - {Path(save_path).stem}"
         self.setWindowTitle(window_title)
 
-    def onGameGenerated(self, game: Game):
-        self.updateWindowTitle()
+    def onGameGenerated(self, game: Game, save_path: Optional[str] = None):
+        self.updateWindowTitle(save_path)
         logging.info("On Game generated")
         self.game = game
         GameUpdateSignal.get_instance().game_loaded.emit(self.game)
@@ -433,17 +634,13 @@ def onEndGame(self, state: TurnState):
         if state == TurnState.CONTINUE:
             return
 
-        for window in QApplication.topLevelWidgets():
-            if window is not self:
-                window.close()
+        self.close_other_windows()
 
         GameUpdateSignal.get_instance().updateGame(None)
 
         self.top_panel.setControls(False)
 
-        title = "Victory!" if TurnState.WIN else "Defeat!"
-        msgvar = "won" if TurnState.WIN else "lost"
-        msg = f"You have {msgvar} the campaign, do you wish to start a new one?"
+        title, msg = END_GAME_MESSAGES[state]
         result = QMessageBox.information(
             QApplication.focusWidget(),
             title,
@@ -479,113 +676,36 @@ def setGame(self, game: Optional[Game]):
             self.enable_game_actions(self.game is not None)
 
     def showAboutDialog(self):
-        contributors = [
-            "shdwp",
-            "Khopa",
-            "ColonelPanic",
-            "RndName",
-            "Roach",
-            "Malakhit",
-            "Wrycu",
-            "calvinmorrow",
-            "JohanAberg",
-            "Deus",
-            "SiKruger",
-            "Mustang-25",
-            "bgreman",
-            "magwo",
-            "SnappyComebacks",
-            "kavinsky",
-            "Schneefl0cke",
-            "pbzweihander",
-            "Raskil",
-            "nosv1",
-            "jake-lewis",
-            "teamMOYA",
-            "benedikt-wegmann",
-            "movq",
-            "bbirchnz",
-            "eddiwood",
-            "root0fall",
-            "calvinmorrow",
-            "UKayeF",
-            "Captain Cody",
-            "steveveepee",
-            "pedromagueija",
-            "parithon",
-            "TheCandianVendingMachine",
-            "bwRavencl",
-            "davidp57",
-            "Plob",
-            "Hawkmoon",
-            "alrik11es",
-            "Starfire13",
-            "Hornet2041/Lion",
-            "SgtFuzzle17",
-            "Doc_of_Mur",
-            "NickJZX",
-            "Sith1144",
-            "Raffson",
-            "MetalStormGhost",
-            "HolyOrangeJuice (WRL)",
-            "Adecarcer",
-            "pande4360",
-            "zhexu14",
-            "ColonelAkirNakesh",
-            "Nosajthedevil",
-            "kivipe",
-            "Turbolious",
-            "ingax01",
-            "M-Chimiste",
-            "tmz42",
-        ]
-        text = (
-            "<h3>DCS Retribution " + VERSION + "</h3>" + "<b>Source code : </b>"
-            "<a href='https://github.com/dcs-retribution/dcs-retribution' style='color:white'>"
-            "https://github.com/dcs-retribution/dcs-retribution </a>"
-            + "<h4>Authors</h4>"
-            + "<p>DCS Retribution is an (independent) fork of DCS Liberation, "
-            "which was originally developed by <b>shdwp</b>. "
-            "DCS Liberation 2.0 is a partial rewrite based on this work by <b>Khopa</b>. "
-            "DCS Retribution was forked during development of "
-            "DCS Liberation v6.0.0 in 2022 by <b>Raffson</> & <b>MetalStormGhost</>."
-            "<h4>Contributors</h4>"
-            + ", ".join(contributors)
-            + "<h4>Special Thanks  :</h4>"
-            "<b>rp-</b> <i>for the pydcs framework</i><br/>"
-            "<b>Grimes (mrSkortch)</b> & <b>Speed</b> <i>for the MIST framework</i><br/>"
-            "<b>Ciribob </b> <i>for the JTACAutoLase.lua script</i><br/>"
-            "<b>Walder </b> <i>for the Skynet-IADS script</i><br/>"
-            "<b>Anubis Yinepu </b> <i>for the Hercules Cargo script</i><br/>"
-            '<a href="https://www.flaticon.com/free-icons/bug" title="bug icons" style="color: #ffffff">Bug icons created by Freepik - Flaticon</a><br />'
-            'Contains information from <a href="https://osmdata.openstreetmap.de/" style="color: #ffffff">OpenStreetMap © OpenStreetMap contributors</a>, which is made available here under the <a href="https://opendatacommons.org/licenses/odbl/1-0/" style="color: #ffffff">Open Database License (ODbL)</a>.<br />'
-            '<a href="https://download.geofabrik.de/index.html/" style="color: #ffffff">OpenStreetMap Data Extracts from Geofabrik</a><br />'
-            '<a href="https://www.earthdata.nasa.gov/" style="color: #ffffff">NASA EarthData</a><br />'
-            + "<h4>Splash Screen  :</h4>"
-            + "Artwork by Andriy Dankovych (CC BY-SA)"
-            " <a href='https://www.facebook.com/AndriyDankovych' style='color:white'>"
-            "[https://www.facebook.com/AndriyDankovych]</a>"
-        )
-        about = QMessageBox()
-        about.setWindowTitle("About DCS Retribution")
-        about.setIcon(QMessageBox.Icon.Information)
-        about.setText(text)
-        logging.info(about.textFormat())
-        about.exec_()
+        if self.about_dialog is None:
+            self.about_dialog = QMessageBox(self)
+            self.about_dialog.setWindowTitle("About DCS Retribution")
+            self.about_dialog.setIcon(QMessageBox.Icon.Information)
+            self.about_dialog.setText(ABOUT_TEXT)
+        self.about_dialog.exec_()
 
     def showLiberationDialog(self):
+        from qt_ui.windows.preferences.QLiberationPreferencesWindow import (
+            QLiberationPreferencesWindow,
+        )
+
         self.subwindow = QLiberationPreferencesWindow()
         self.subwindow.show()
 
     def showSettingsDialog(self) -> None:
+        from qt_ui.windows.settings.QSettingsWindow import QSettingsWindow
+
         self.dialog = QSettingsWindow(self.game)
         self.dialog.show()
 
     def showStatsDialog(self):
+        from qt_ui.windows.stats.QStatsWindow import QStatsWindow
+
         self.dialog = QStatsWindow(self.game)
         self.dialog.show()
 
     def showNotesDialog(self):
+        from qt_ui.windows.notes.QNotesWindow import QNotesWindow
+
         self.dialog = QNotesWindow(self.game)
         self.dialog.show()
 
@@ -593,53 +713,78 @@ def import_templates(self):
         LAYOUTS.import_templates()
 
     def showLogsDialog(self):
+        from qt_ui.windows.logs.QLogsWindow import QLogsWindow
+
         self.dialog = QLogsWindow(self)
         self.dialog.show()
 
     def onDebriefing(self, debrief: Debriefing):
+        from qt_ui.windows.QDebriefingWindow import QDebriefingWindow
+
         logging.info("On Debriefing")
         self.debriefing = QDebriefingWindow(debrief)
         self.debriefing.show()
         self.game_model.init_comms_registry()
 
     def open_tgo_info_dialog(self, tgo: TheaterGroundObject) -> None:
+        from qt_ui.windows.groundobject.QGroundObjectMenu import QGroundObjectMenu
+
         QGroundObjectMenu(self, tgo, tgo.control_point, self.game_model).show()
 
     def open_control_point_info_dialog(self, cp: ControlPoint) -> None:
+        from qt_ui.windows.basemenu.QBaseMenu2 import QBaseMenu2
+
         self._cp_dialog = QBaseMenu2(None, cp, self.game_model)
         self._cp_dialog.show()
 
     def _qsettings(self) -> QSettings:
-        return QSettings("DCS Retribution", "Qt UI")
+        if self._settings is None:
+            self._settings = QSettings("DCS Retribution", "Qt UI")
+        return self._settings
 
     def _restore_window_geometry(self) -> None:
         settings = self._qsettings()
-        self.restoreGeometry(settings.value("geometry"))
-        self.restoreState(settings.value("windowState"))
+        # Nothing is stored until the window has been closed once.
+        geometry = settings.value("geometry")
+        if geometry is not None:
+            self.restoreGeometry(geometry)
+        window_state = settings.value("windowState")
+        if window_state is not None:
+            self.restoreState(window_state)
 
     def _save_window_geometry(self) -> None:
         settings = self._qsettings()
         settings.setValue("geometry", self.saveGeometry())
         settings.setValue("windowState", self.saveState())
 
+    def close_other_windows(self) -> None:
+        # Snapshot the list first since closing windows can change it.
+        others = tuple(w for w in QApplication.topLevelWidgets() if w is not self)
+        for window in others:
+            window.close()
+
     def closeEvent(self, event: QCloseEvent) -> None:
-        result = QMessageBox.question(
-            self,
-            "Quit Retribution?",
-            "Would you like to save before quitting?",
-            QMessageBox.StandardButton.Yes
-            | QMessageBox.StandardButton.No
-            | QMessageBox.StandardButton.Cancel,
-            QMessageBox.StandardButton.Cancel,
-        )
-        if result in [QMessageBox.StandardButton.Yes, QMessageBox.StandardButton.No]:
+        # There is nothing to save without a game, so don't ask.
+        if self.game is not None:
+            result = QMessageBox.question(
+                self,
+                "Quit Retribution?",
+                "Would you like to save before quitting?",
+                QMessageBox.StandardButton.Yes
+                | QMessageBox.StandardButton.No
+                | QMessageBox.StandardButton.Cancel,
+                QMessageBox.StandardButton.Cancel,
+            )
+            if result not in [
+                QMessageBox.StandardButton.Yes,
+                QMessageBox.StandardButton.No,
+            ]:
+                event.ignore()
+                return
             if result == QMessageBox.StandardButton.Yes:
                 self.saveGame()
-            self._save_window_geometry()
-            super().closeEvent(event)
-            self.dialog = None
-            self.debriefing = None
-            for window in QApplication.topLevelWidgets():
-                window.close()
-        else:
-            event.ignore()
+        self._save_window_geometry()
+        super().closeEvent(event)
+        self.dialog = None
+        self.debriefing = None
+        self.close_other_windows()
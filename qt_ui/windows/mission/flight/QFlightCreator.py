@@ -29,9 +29,12 @@
 from qt_ui.widgets.combos.QAircraftTypeSelector import QAircraftTypeSelector
 from qt_ui.widgets.combos.QArrivalAirfieldSelector import QArrivalAirfieldSelector
 from qt_ui.widgets.combos.QFlightTypeComboBox import QFlightTypeComboBox
+from qt_ui.widgets.combos.comboitems import add_combo_items
 from qt_ui.windows.mission.flight.SquadronSelector import SquadronSelector
 from qt_ui.windows.mission.flight.settings.QFlightSlotEditor import FlightRosterEditor
 
+START_TYPE_ITEMS = [(start_type.value, start_type) for start_type in StartType]
+
 
 class QFlightCreator(QDialog):
     created = Signal(Flight)
@@ -78,7 +81,7 @@ def __init__(
         layout.addLayout(QLabeledWidget("Squadron:", self.squadron_selector))
 
         self.divert = QArrivalAirfieldSelector(
-            [cp for cp in game.theater.controlpoints if cp.captured == is_ownfor],
+            game.theater.control_points_for(is_ownfor),
             self.aircraft_selector.currentData(),
             "None",
         )
@@ -91,6 +94,10 @@ def __init__(
         hbox = QHBoxLayout()
         self.loadout_selector = QComboBox()
         self.loadout_selector.setMaximumWidth(250)
+        self.loadout_selector.setSizeAdjustPolicy(
+            QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon
+        )
+        self.loadout_selector.setMinimumContentsLength(20)
         self.loadout_selector.setItemDelegate(LoadoutDelegate(self.loadout_selector))
         self._init_loadout_selector()
         hbox.addWidget(QLabel("Loadout:"))
@@ -121,8 +128,7 @@ def __init__(
         # we restore the previous choice.
         self.restore_start_type: Optional[str] = None
         self.start_type = QComboBox()
-        for start_type in StartType:
-            self.start_type.addItem(start_type.value, userData=start_type)
+        add_combo_items(self.start_type, START_TYPE_ITEMS)
         self.start_type.setCurrentText(self.game.settings.default_start_type.value)
         layout.addLayout(
             QLabeledWidget(
@@ -256,17 +262,23 @@ def on_task_changed(self, index: int) -> None:
 
     def on_squadron_changed(self, index: int) -> None:
         squadron: Optional[Squadron] = self.squadron_selector.itemData(index)
-        self.update_max_size(self.squadron_selector.aircraft_available)
-        # Clear the roster first so we return the pilots to the pool. This way if we end
-        # up repopulating from the same squadron we'll get the same pilots back.
-        self.roster_editor.replace(None, None)
-        if squadron is not None:
-            self.roster_editor.replace(
-                squadron, FlightRoster(squadron, self.flight_size_spinner.value())
-            )
-            self.on_departure_changed(squadron.location)
-
-            self.roster_editor.pilots_changed.emit()
+        # Resizing and replacing the roster would each report the pilots. Only do so
+        # once everything, including the start type, is up to date.
+        self.roster_editor.blockSignals(True)
+        try:
+            self.update_max_size(self.squadron_selector.aircraft_available)
+            # Clear the roster first so we return the pilots to the pool. This way if
+            # we end up repopulating from the same squadron we'll get the same pilots
+            # back.
+            self.roster_editor.replace(None, None)
+            if squadron is not None:
+                self.roster_editor.replace(
+                    squadron, FlightRoster(squadron, self.flight_size_spinner.value())
+                )
+                self.on_departure_changed(squadron.location)
+        finally:
+            self.roster_editor.blockSignals(False)
+        self.roster_editor.pilots_changed.emit()
 
     def update_max_size(self, available: int) -> None:
         aircraft = self.aircraft_selector.currentData()
@@ -314,20 +326,24 @@ def current_loadout(self) -> Loadout:
     def _init_loadout_selector(self):
         self.loadout_selector.clear()
         ac_type = self.aircraft_selector.currentData()
-        if ac_type is None or not any(list(Loadout.iter_for_aircraft(ac_type))):
+        loadouts = [] if ac_type is None else list(Loadout.iter_for_aircraft(ac_type))
+        if not loadouts:
             self.loadout_selector.addItem("No loadouts available", None)
             self.loadout_selector.setDisabled(True)
             return
         else:
             self.loadout_selector.setDisabled(False)
-        for loadout in Loadout.iter_for_aircraft(ac_type):
-            self.loadout_selector.addItem(loadout.name, loadout)
-        for loadout in Loadout.default_loadout_names_for(
-            self.task_selector.currentData()
-        ):
-            index = self.loadout_selector.findText(loadout)
-            if index != -1:
-                self.loadout_selector.setCurrentIndex(index)
+        add_combo_items(
+            self.loadout_selector, ((loadout.name, loadout) for loadout in loadouts)
+        )
+        # Like findText, prefer the first loadout with a given name.
+        indices: dict[str, int] = {}
+        for index, loadout in enumerate(loadouts):
+            indices.setdefault(loadout.name, index)
+        for name in Loadout.default_loadout_names_for(self.task_selector.currentData()):
+            default_index = indices.get(name)
+            if default_index is not None:
+                self.loadout_selector.setCurrentIndex(default_index)
                 break
 
 
@@ -1,4 +1,5 @@
 import logging
+from bisect import insort
 from typing import Optional, Callable
 
 from PySide6.QtCore import Signal, QModelIndex
@@ -18,7 +19,7 @@
 )
 
 from game import Game
-from game.ato.closestairfields import ClosestAirfields
+from game.ato.closestairfields import ObjectiveDistanceCache
 from game.ato.flight import Flight
 from game.ato.flightroster import FlightRoster
 from game.ato.iflightroster import IFlightRoster
@@ -28,6 +29,12 @@
 from game.theater import ControlPoint, OffMapSpawn
 from game.utils import nautical_miles
 from qt_ui.models import PackageModel
+from qt_ui.widgets.combos.comboitems import add_combo_items
+
+
+def pilot_sort_key(pilot: Pilot) -> tuple[bool, str]:
+    # Put players first, otherwise alphabetically.
+    return not pilot.player, pilot.name
 
 
 class PilotSelector(QComboBox):
@@ -40,13 +47,20 @@ def __init__(
         self.squadron = squadron
         self.roster = roster
         self.pilot_index = idx
+        # The selector is rebuilt whenever any pilot in the flight changes, so size it
+        # by a fixed length rather than by measuring every pilot name each time.
+        self.setSizeAdjustPolicy(
+            QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon
+        )
+        self.setMinimumContentsLength(20)
+        self.currentIndexChanged.connect(self.replace_pilot)
         self.rebuild()
 
     @staticmethod
     def text_for(pilot: Pilot) -> str:
         return pilot.name
 
-    def _do_rebuild(self) -> None:
+    def _do_rebuild(self, sorted_pilots: Optional[list[Pilot]] = None) -> None:
         self.clear()
         if self.roster is None or self.pilot_index >= self.roster.max_size:
             self.addItem("No aircraft", None)
@@ -57,28 +71,29 @@ def _do_rebuild(self) -> None:
             raise RuntimeError("squadron cannot be None if roster is set")
 
         self.setEnabled(True)
-        self.addItem("Unassigned", None)
-        choices = list(self.squadron.available_pilots)
+        if sorted_pilots is None:
+            choices = sorted(self.squadron.available_pilots, key=pilot_sort_key)
+        else:
+            choices = list(sorted_pilots)
         current_pilot = self.roster.pilot_at(self.pilot_index)
         if current_pilot is not None:
-            choices.append(current_pilot)
-        # Put players first, otherwise alphabetically.
-        for pilot in sorted(choices, key=lambda p: (not p.player, p.name)):
-            self.addItem(self.text_for(pilot), pilot)
+            insort(choices, current_pilot, key=pilot_sort_key)
+        items: list[tuple[str, Optional[Pilot]]] = [("Unassigned", None)]
+        items.extend((self.text_for(pilot), pilot) for pilot in choices)
+        add_combo_items(self, items)
         if current_pilot is None:
             self.setCurrentText("Unassigned")
         else:
             self.setCurrentText(self.text_for(current_pilot))
-        self.currentIndexChanged.connect(self.replace_pilot)
 
-    def rebuild(self) -> None:
+    def rebuild(self, sorted_pilots: Optional[list[Pilot]] = None) -> None:
         # The contents of the selector depend on the selection of the other selectors
         # for the flight, so changing the selection of one causes each selector to
         # rebuild. A rebuild causes a selection change, so if we don't block signals
         # during a rebuild we'll never stop rebuilding.
         self.blockSignals(True)
         try:
-            self._do_rebuild()
+            self._do_rebuild(sorted_pilots)
         finally:
             self.blockSignals(False)
 
@@ -166,11 +181,13 @@ def on_pilot_changed(self, index: int) -> None:
             # pilot which you switch to a non-client pilot
             self.pilots_changed.emit()
 
-    def update_available_pilots(self) -> None:
-        self.selector.rebuild()
+    def update_available_pilots(
+        self, sorted_pilots: Optional[list[Pilot]] = None
+    ) -> None:
+        self.selector.rebuild(sorted_pilots)
 
-    def enable_and_reset(self) -> None:
-        self.selector.rebuild()
+    def enable_and_reset(self, sorted_pilots: Optional[list[Pilot]] = None) -> None:
+        self.selector.rebuild(sorted_pilots)
         self.player_checkbox.setEnabled(True)
         self.on_pilot_changed(self.selector.currentIndex())
 
@@ -222,21 +239,38 @@ def callback() -> None:
             self.pilot_controls.append(controls)
             self.addLayout(controls)
 
+    def sorted_available_pilots(self) -> Optional[list[Pilot]]:
+        # The pool of available pilots is the same for every selector, so it only needs
+        # to be sorted once per update.
+        if self.roster is None:
+            return None
+        return sorted(self.roster.squadron.available_pilots, key=pilot_sort_key)
+
     def update_available_pilots(self, source_idx: int) -> None:
+        sorted_pilots = self.sorted_available_pilots()
         for idx, controls in enumerate(self.pilot_controls):
             # No need to reset the source of the reset, it was just manually selected.
             if idx != source_idx:
-                controls.update_available_pilots()
+                controls.update_available_pilots(sorted_pilots)
 
     def resize(self, new_size: int) -> None:
         if new_size > self.MAX_PILOTS:
             raise ValueError("A flight may not have more than four pilots.")
         if self.roster is not None:
             self.roster.resize(new_size)
-        for controls in self.pilot_controls[:new_size]:
-            controls.enable_and_reset()
-        for controls in self.pilot_controls[new_size:]:
-            controls.disable_and_clear()
+        # Resizing moves pilots in or out of the pool, so every enabled selector needs
+        # to be rebuilt, but they can share one sorted copy of it.
+        sorted_pilots = self.sorted_available_pilots()
+        # Each reset control reports its own change. Report the resize once instead.
+        old_state = self.blockSignals(True)
+        try:
+            for controls in self.pilot_controls[:new_size]:
+                controls.enable_and_reset(sorted_pilots)
+            for controls in self.pilot_controls[new_size:]:
+                controls.disable_and_clear()
+        finally:
+            self.blockSignals(old_state)
+        self.pilots_changed.emit()
 
     def replace(
         self, squadron: Optional[Squadron], new_roster: Optional[FlightRoster]
@@ -244,8 +278,13 @@ def replace(
         if self.roster is not None:
             self.roster.clear()
         self.roster = new_roster
-        for controls in self.pilot_controls:
-            controls.replace(squadron, new_roster)
+        # Callers emit pilots_changed themselves once they're done updating.
+        old_state = self.blockSignals(True)
+        try:
+            for controls in self.pilot_controls:
+                controls.replace(squadron, new_roster)
+        finally:
+            self.blockSignals(old_state)
 
 
 class QSquadronSelector(QDialog):
@@ -261,19 +300,22 @@ def init(self):
 
         self.selector = QComboBox()
         air_wing = self.flight.coalition.air_wing
-        for squadron in air_wing.best_squadrons_for(
+        squadrons = air_wing.best_squadrons_for(
             self.flight.package.target,
             self.flight.flight_type,
             self.flight.roster.max_size,
             self.flight.is_helo,
             True,
             ignore_range=True,
-        ):
-            if squadron is self.flight.squadron:
-                continue
-            self.selector.addItem(
-                f"{squadron.name} - {squadron.aircraft.variant_id}", squadron
-            )
+        )
+        add_combo_items(
+            self.selector,
+            (
+                (f"{squadron.name} - {squadron.aircraft.variant_id}", squadron)
+                for squadron in squadrons
+                if squadron is not self.flight.squadron
+            ),
+        )
 
         vbox.addWidget(self.selector)
 
@@ -302,10 +344,6 @@ def __init__(
         self.package_model = package_model
         self.flight = flight
         self.game = game
-        self.closest_airfields = ClosestAirfields(
-            flight.package.target,
-            list(game.theater.control_points_for(self.flight.coalition.player)),
-        )
         available = self.flight.squadron.untasked_aircraft
         max_count = self.flight.count + available
         if max_count > 4:
@@ -363,9 +401,12 @@ def _find_divert_field(
         self, aircraft: AircraftType, arrival: ControlPoint
     ) -> Optional[ControlPoint]:
         divert_limit = nautical_miles(150)
-        for airfield in self.closest_airfields.operational_airfields_within(
-            divert_limit
-        ):
+        # Shared with the rest of the game, so the theater's control points are only
+        # sorted by distance to the target once.
+        closest_airfields = ObjectiveDistanceCache.get_closest_airfields(
+            self.flight.package.target
+        )
+        for airfield in closest_airfields.operational_airfields_within(divert_limit):
             if airfield.captured != self.flight.coalition.player:
                 continue
             if airfield == arrival:
@@ -1,7 +1,17 @@
-from typing import Optional
+from datetime import datetime
+from typing import Any, Optional
 
-from PySide6.QtCore import QItemSelectionModel, QPoint, QModelIndex
-from PySide6.QtGui import QStandardItem, QStandardItemModel
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QAbstractTableModel,
+    QItemSelectionModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QPoint,
+    QSize,
+    Qt,
+)
 from PySide6.QtWidgets import (
     QHeaderView,
     QTableView,
@@ -9,6 +19,7 @@
     QWidget,
     QStyleOptionViewItem,
     QDoubleSpinBox,
+    QSizePolicy,
 )
 
 from game.ato.flight import Flight
@@ -16,35 +27,264 @@
 from game.ato.flightwaypointtype import FlightWaypointType
 from game.ato.package import Package
 from game.utils import Distance
-from qt_ui.windows.mission.flight.waypoints.QFlightWaypointItem import QWaypointItem
 
 HEADER_LABELS = ["Name", "Alt (ft)", "Alt Type", "TOT/DEPART"]
+# Set up front so the view doesn't have to measure every cell to lay out the columns.
+# The name column is widened to fit the longest name when the list is updated.
+COLUMN_WIDTHS = [140, 60, 60, 110]
+NAME_COLUMN_PADDING = 12
 
 
 class AltitudeEditorDelegate(QStyledItemDelegate):
     def createEditor(
-        self, parent: QWidget, option: QStyleOptionViewItem, index: QModelIndex
+        self,
+        parent: QWidget,
+        option: QStyleOptionViewItem,
+        index: QModelIndex | QPersistentModelIndex,
     ) -> QDoubleSpinBox:
         editor = QDoubleSpinBox(parent)
         editor.setMinimum(0)
         editor.setMaximum(40000)
         return editor
 
+    def setEditorData(
+        self, editor: QWidget, index: QModelIndex | QPersistentModelIndex
+    ) -> None:
+        assert isinstance(editor, QDoubleSpinBox)
+        editor.setValue(float(index.data(Qt.ItemDataRole.EditRole)))
+
+    def setModelData(
+        self,
+        editor: QWidget,
+        model: QAbstractItemModel,
+        index: QModelIndex | QPersistentModelIndex,
+    ) -> None:
+        assert isinstance(editor, QDoubleSpinBox)
+        editor.interpretText()
+        model.setData(index, editor.value(), Qt.ItemDataRole.EditRole)
+
+
+class WaypointTableModel(QAbstractTableModel):
+    """The model for the waypoints of a flight plan.
+
+    The display text of every cell is formatted once by refresh, and stored by column.
+    The model is empty until refresh is called, which must be done again whenever the
+    flight plan changes.
+    """
+
+    WaypointRole = Qt.ItemDataRole.UserRole
+
+    NAME_COLUMN = 0
+    ALTITUDE_COLUMN = 1
+    ALTITUDE_TYPE_COLUMN = 2
+    TOT_COLUMN = 3
+
+    def __init__(self, flight: Flight, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.flight = flight
+        self.waypoints: list[FlightWaypoint] = []
+        self.display_texts: list[list[str]] = [[] for _ in HEADER_LABELS]
+
+    def refresh(self) -> bool:
+        """Reloads the model from the flight plan.
+
+        The model is only reset if the number of waypoints changed. Otherwise every
+        cell is reported as changed and the views keep their selection, or nothing is
+        reported if neither the waypoints nor their texts changed. Returns True if the
+        model was reset.
+        """
+        waypoints = self.flight.flight_plan.waypoints
+        # Waypoints are edited in place (e.g. dragged on the map), and that can change
+        # the TOTs of the waypoints after them, so the texts must always be rebuilt
+        # to tell whether anything changed.
+        display_texts = [
+            [self.name_text(w) for w in waypoints],
+            [self.altitude_text(w) for w in waypoints],
+            [self.altitude_type_text(w) for w in waypoints],
+            self.tot_texts_for(waypoints),
+        ]
+        if len(waypoints) != len(self.waypoints):
+            self.beginResetModel()
+            self.waypoints = waypoints
+            self.display_texts = display_texts
+            self.endResetModel()
+            return True
+        changed = display_texts != self.display_texts or any(
+            a is not b for a, b in zip(waypoints, self.waypoints)
+        )
+        self.waypoints = waypoints
+        self.display_texts = display_texts
+        if changed:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(self.rowCount() - 1, self.columnCount() - 1),
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole],
+            )
+        return False
+
+    def rowCount(
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.waypoints)
+
+    def columnCount(
+        self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()
+    ) -> int:
+        if parent.isValid():
+            return 0
+        return len(HEADER_LABELS)
+
+    def data(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        # The view asks for every role of every visible cell on each paint, so the
+        # roles this model doesn't provide need to be rejected cheaply.
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.display_texts[index.column()][index.row()]
+        if role == Qt.ItemDataRole.EditRole:
+            waypoint = self.waypoints[index.row()]
+            if index.column() == self.NAME_COLUMN:
+                return waypoint.pretty_name
+            if index.column() == self.ALTITUDE_COLUMN:
+                return round(waypoint.alt.feet)
+            return None
+        if role == WaypointTableModel.WaypointRole:
+            return self.waypoints[index.row()]
+        return None
+
+    def setData(
+        self,
+        index: QModelIndex | QPersistentModelIndex,
+        value: Any,
+        role: int = Qt.ItemDataRole.EditRole,
+    ) -> bool:
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        waypoint = self.waypoints[index.row()]
+        if index.column() == self.NAME_COLUMN:
+            name = str(value)
+            if waypoint.pretty_name == name:
+                return True
+            waypoint.pretty_name = name
+            self.display_texts[self.NAME_COLUMN][index.row()] = self.name_text(waypoint)
+        elif index.column() == self.ALTITUDE_COLUMN:
+            feet = float(value)
+            # Closing the editor commits its value even if it was left unchanged.
+            if round(waypoint.alt.feet) == round(feet):
+                return True
+            waypoint.alt = Distance.from_feet(feet)
+            self.display_texts[self.ALTITUDE_COLUMN][index.row()] = self.altitude_text(
+                waypoint
+            )
+            # Travel times after this waypoint may have changed with its altitude.
+            self.display_texts[self.TOT_COLUMN] = self.tot_texts_for(self.waypoints)
+            self.dataChanged.emit(
+                index,
+                self.index(self.rowCount() - 1, self.TOT_COLUMN),
+                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole],
+            )
+            return True
+        else:
+            return False
+        self.dataChanged.emit(
+            index, index, [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole]
+        )
+        return True
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if index.column() in (self.NAME_COLUMN, self.ALTITUDE_COLUMN):
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return HEADER_LABELS[section]
+        return str(section)
+
+    @staticmethod
+    def name_text(waypoint: FlightWaypoint) -> str:
+        return "{:<16}".format(waypoint.pretty_name)
+
+    @staticmethod
+    def altitude_text(waypoint: FlightWaypoint) -> str:
+        return str(round(waypoint.alt.feet))
+
+    @staticmethod
+    def altitude_type_text(waypoint: FlightWaypoint) -> str:
+        return "AGL" if waypoint.alt_type == "RADIO" else "MSL"
+
+    @staticmethod
+    def clock_text(time: datetime) -> str:
+        # Same as formatting with %H:%M:%S, but skips strftime.
+        return time.time().isoformat(timespec="seconds")
+
+    def tot_texts_for(self, waypoints: list[FlightWaypoint]) -> list[str]:
+        flight_plan = self.flight.flight_plan
+        texts = []
+        last_waypoint: Optional[FlightWaypoint] = None
+        last_tot: Optional[datetime] = None
+        for waypoint in waypoints:
+            if waypoint.waypoint_type == FlightWaypointType.TAKEOFF:
+                last_tot = flight_plan.takeoff_time()
+                last_waypoint = waypoint
+                texts.append(self.clock_text(last_tot))
+                continue
+            prefix = ""
+            time = flight_plan.tot_for_waypoint(waypoint)
+            if time is None:
+                prefix = "Depart "
+                time = flight_plan.depart_time_for_waypoint(waypoint)
+            if time is None and last_waypoint is not None and last_tot is not None:
+                prefix = ""
+                time = last_tot + flight_plan.travel_time_between_waypoints(
+                    last_waypoint, waypoint
+                )
+            elif time is None:
+                texts.append("")
+                continue
+            last_tot = time
+            last_waypoint = waypoint
+            texts.append(f"{prefix}{self.clock_text(time)}")
+        return texts
+
 
 class QFlightWaypointList(QTableView):
     def __init__(self, package: Package, flight: Flight):
         super().__init__()
-        self._last_waypoint: Optional[FlightWaypoint] = None
         self.package = package
         self.flight = flight
 
-        self.model = QStandardItemModel(self)
-        self.model.itemChanged.connect(self.on_changed)
-        self.setModel(self.model)
-        self.model.setHorizontalHeaderLabels(HEADER_LABELS)
+        self.waypoint_model = WaypointTableModel(flight, self)
+        self.setModel(self.waypoint_model)
 
         header = self.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        for column, width in enumerate(COLUMN_WIDTHS):
+            header.resizeSection(column, width)
+        header.sectionResized.connect(self.on_section_resized)
+
+        vertical_header = self.verticalHeader()
+        vertical_header.setMaximumWidth(25)
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(self.fontMetrics().height() + 4)
+
+        # The table is always as wide as its columns, see sizeHint.
+        self.setSizePolicy(QSizePolicy.Policy.Fixed, self.sizePolicy().verticalPolicy())
+
         self.update_list()
 
         self.selectionModel().setCurrentIndex(
@@ -55,99 +295,39 @@ def __init__(self, package: Package, flight: Flight):
         self.setItemDelegateForColumn(1, self.altitude_editor_delegate)
 
     def update_list(self) -> None:
-        # ignore signals when updating list so on_changed does not fire
-        self.model.blockSignals(True)
+        # We need to keep just the row and rebuild the index later because the
+        # QModelIndex will not be valid if the model is reset.
+        current_index = self.currentIndex().row()
+        # Don't repaint between the reset and restoring the selection.
+        self.setUpdatesEnabled(False)
         try:
-            # We need to keep just the row and rebuild the index later because the
-            # QModelIndex will not be valid after the model is cleared.
-            current_index = self.currentIndex().row()
-            self.model.clear()
-
-            self.model.setHorizontalHeaderLabels(HEADER_LABELS)
-
-            waypoints = self.flight.flight_plan.waypoints
-            for row, waypoint in enumerate(waypoints):
-                self._add_waypoint_row(row, self.flight, waypoint)
-            self.selectionModel().setCurrentIndex(
-                self.model.index(current_index, 0),
-                QItemSelectionModel.SelectionFlag.Select,
-            )
-            self.model.setVerticalHeaderLabels([str(n) for n in range(len(waypoints))])
-            self.verticalHeader().setMaximumWidth(25)
-
-            self.resizeColumnsToContents()
-            total_column_width = self.verticalHeader().width() + self.lineWidth()
-            for i in range(0, self.model.columnCount()):
-                total_column_width += self.columnWidth(i) + self.lineWidth()
-            self.setFixedWidth(total_column_width)
+            if self.waypoint_model.refresh() and current_index >= 0:
+                self.selectionModel().setCurrentIndex(
+                    self.waypoint_model.index(current_index, 0),
+                    QItemSelectionModel.SelectionFlag.Select,
+                )
+            self.resize_name_column()
         finally:
-            # stop ignoring signals
-            self.model.blockSignals(False)
-            self.update(self.currentIndex())
+            self.setUpdatesEnabled(True)
+        self.update(self.currentIndex())
 
-    def _add_waypoint_row(
-        self,
-        row: int,
-        flight: Flight,
-        waypoint: FlightWaypoint,
-    ) -> None:
-        self.model.insertRow(self.model.rowCount())
-
-        self.model.setItem(row, 0, QWaypointItem(waypoint, row))
-
-        altitude = round(waypoint.alt.feet)
-        altitude_item = QStandardItem(f"{altitude}")
-        altitude_item.setEditable(True)
-        self.model.setItem(row, 1, altitude_item)
-
-        altitude_type = "AGL" if waypoint.alt_type == "RADIO" else "MSL"
-        altitude_type_item = QStandardItem(f"{altitude_type}")
-        altitude_type_item.setEditable(False)
-        self.model.setItem(row, 2, altitude_type_item)
-
-        tot = self.tot_text(flight, waypoint)
-        tot_item = QStandardItem(tot)
-        tot_item.setEditable(False)
-        self.model.setItem(row, 3, tot_item)
-
-    def on_changed(self) -> None:
-        for i in range(self.model.rowCount()):
-            altitude = self.model.item(i, 1).text()
-            altitude_feet = float(altitude)
-            self.flight.flight_plan.waypoints[i].alt = Distance.from_feet(altitude_feet)
-            name = self.model.item(i, 0).text()
-            self.flight.flight_plan.waypoints[i].pretty_name = name
-
-    def tot_text(
-        self,
-        flight: Flight,
-        waypoint: FlightWaypoint,
-    ) -> str:
-        if waypoint.waypoint_type == FlightWaypointType.TAKEOFF:
-            self.update_last_tot(flight.flight_plan.takeoff_time())
-            self._last_waypoint = waypoint
-            return self.takeoff_text(flight)
-        prefix = ""
-        time = flight.flight_plan.tot_for_waypoint(waypoint)
-        if time is None:
-            prefix = "Depart "
-            time = flight.flight_plan.depart_time_for_waypoint(waypoint)
-        if time is None and self._last_waypoint is not None:
-            prefix = ""
-            timedelta = flight.flight_plan.travel_time_between_waypoints(
-                self._last_waypoint, waypoint
-            )
-            time = self._last_tot + timedelta
-        elif time is None:
-            return ""
-        self.update_last_tot(time)
-        self._last_waypoint = waypoint
-        return f"{prefix}{time:%H:%M:%S}"
+    def resize_name_column(self) -> None:
+        names = self.waypoint_model.display_texts[WaypointTableModel.NAME_COLUMN]
+        metrics = self.fontMetrics()
+        width = max(
+            [COLUMN_WIDTHS[WaypointTableModel.NAME_COLUMN]]
+            + [metrics.horizontalAdvance(name) + NAME_COLUMN_PADDING for name in names]
+        )
+        header = self.horizontalHeader()
+        if header.sectionSize(WaypointTableModel.NAME_COLUMN) < width:
+            header.resizeSection(WaypointTableModel.NAME_COLUMN, width)
 
-    @staticmethod
-    def takeoff_text(flight: Flight) -> str:
-        return f"{flight.flight_plan.takeoff_time():%H:%M:%S}"
+    def on_section_resized(self, _index: int, _old_size: int, _new_size: int) -> None:
+        self.updateGeometry()
 
-    def update_last_tot(self, time) -> None:
-        if time is not None:
-            self._last_tot = time
+    def sizeHint(self) -> QSize:
+        header = self.horizontalHeader()
+        width = self.verticalHeader().width() + self.lineWidth()
+        for column in range(len(COLUMN_WIDTHS)):
+            width += header.sectionSize(column) + self.lineWidth()
+        return QSize(width, super().sizeHint().height())
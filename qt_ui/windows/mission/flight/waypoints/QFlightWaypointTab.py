@@ -106,12 +106,12 @@ def on_add_nav(self):
             return
         index: QModelIndex = selected[0]
         self.flight_waypoint_list.setCurrentIndex(index)
-        wpt: FlightWaypoint = self.flight_waypoint_list.model.data(
+        wpt: FlightWaypoint = self.flight_waypoint_list.waypoint_model.data(
             index, Qt.ItemDataRole.UserRole
         )
         next_wpt: Optional[FlightWaypoint] = None
-        if index.row() + 1 < self.flight_waypoint_list.model.rowCount():
-            next_wpt = self.flight_waypoint_list.model.data(
+        if index.row() + 1 < self.flight_waypoint_list.waypoint_model.rowCount():
+            next_wpt = self.flight_waypoint_list.waypoint_model.data(
                 index.siblingAtRow(index.row() + 1), Qt.ItemDataRole.UserRole
             )
         if not self.flight.flight_plan.layout.add_waypoint(wpt, next_wpt):
@@ -122,9 +122,6 @@ def on_add_nav(self):
                 "Please select a different waypoint to insert the new NAV waypoint.",
             )
         else:
-            self.flight_waypoint_list.model.insertRow(
-                self.flight_waypoint_list.model.rowCount()
-            )
             self.on_change()
 
     def on_delete_waypoint(self):
@@ -148,16 +145,13 @@ def delete_waypoint(self, waypoint: FlightWaypoint) -> None:
             if is_target and count > 1:
                 fp.target_area_waypoint.targets.remove(waypoint)
                 return
-        model = self.flight_waypoint_list.model
         if fp.layout.delete_waypoint(waypoint):
-            model.removeRow(model.rowCount() - 1)
             return
 
         if not self.flight.flight_plan.is_custom:
             confirmed = self.confirm_degrade()
             if not confirmed:
                 return
-        model.removeRow(model.rowCount() - 1)
         self.degrade_to_custom_flight_plan()
         assert isinstance(self.flight.flight_plan, CustomFlightPlan)
         self.flight.flight_plan.layout.custom_waypoints.remove(waypoint)
@@ -185,11 +179,6 @@ def on_waypoints_added(self, waypoints: Iterable[FlightWaypoint]) -> None:
         if not waypoints:
             return
         self.flight.flight_plan.layout.custom_waypoints.extend(waypoints)
-        self.add_rows(len(list(waypoints)))
-
-    def add_rows(self, count: int) -> None:
-        rc = self.flight_waypoint_list.model.rowCount()
-        self.flight_waypoint_list.model.insertRows(rc, count)
         self.on_change()
 
     def on_rtb_waypoint(self):
@@ -197,7 +186,7 @@ def on_rtb_waypoint(self):
         self.degrade_to_custom_flight_plan()
         assert isinstance(self.flight.flight_plan, CustomFlightPlan)
         self.flight.flight_plan.layout.custom_waypoints.append(rtb)
-        self.add_rows(1)
+        self.on_change()
 
     def degrade_to_custom_flight_plan(self) -> None:
         if not isinstance(self.flight.flight_plan, CustomFlightPlan):
@@ -237,5 +226,4 @@ def confirm_recreate(self, task: FlightType) -> None:
 
     def on_change(self):
         self.flight_waypoint_list.update_list()
-        self.flight_waypoint_list.on_changed()
         self.update()
@@ -0,0 +1,31 @@
+import pytest
+
+from game.pretense.pretenseflightgroupspawner import PretenseNameGenerator
+
+
+@pytest.mark.parametrize(
+    "cp_name,expected",
+    [
+        ("Kärdla (Ø-1)_", "Kardla O-1"),
+        ("Öresund Ärö", "Oresund Aro"),
+        ("CVN-74 John C. Stennis", "CVN-74 John C Stennis"),
+    ],
+)
+def test_pretense_zone_name(cp_name: str, expected: str) -> None:
+    assert PretenseNameGenerator.pretense_zone_name(cp_name) == expected
+
+
+def test_pretense_trimmed_cp_name() -> None:
+    assert PretenseNameGenerator.pretense_trimmed_cp_name("12 Kärdla-Ø") == "kardlao"
+
+
+@pytest.mark.parametrize(
+    "cp_name", ["Kärdla (Ø-1)_", "CVN-74 John C. Stennis", "Ärö Carrier Group"]
+)
+def test_trimmed_zone_name_matches_trimmed_cp_name(cp_name: str) -> None:
+    # Carrier Lua is generated from the zone name, but its air groups are registered
+    # under the trimmed control point name, so the two must agree.
+    zone_name = PretenseNameGenerator.pretense_zone_name(cp_name)
+    assert PretenseNameGenerator.pretense_trimmed_cp_name(
+        zone_name
+    ) == PretenseNameGenerator.pretense_trimmed_cp_name(cp_name)
@@ -0,0 +1,41 @@
+from typing import Any
+
+import pytest
+from dcs import Mission
+
+from game import Game
+from game.ato import FlightType
+from game.missiongenerator.missiondata import MissionData
+from game.pretense.pretenseluagenerator import (
+    PRETENSE_BLUE_SIDE,
+    PRETENSE_RED_SIDE,
+    PretenseLuaGenerator,
+)
+
+
+@pytest.fixture(name="game")
+def game_fixture(mocker: Any) -> Game:
+    game = mocker.Mock(spec=Game)
+    game.pretense_air = {PRETENSE_RED_SIDE: {}, PRETENSE_BLUE_SIDE: {}}
+    game.pretense_ground_supply = {PRETENSE_RED_SIDE: {}, PRETENSE_BLUE_SIDE: {}}
+    game.pretense_ground_assault = {PRETENSE_RED_SIDE: {}, PRETENSE_BLUE_SIDE: {}}
+    return game
+
+
+def test_init_pretense_zone_registers_both_sides(game: Game) -> None:
+    # The zone is already registered for blue only, as happens when the blue
+    # aircraft generator runs first.
+    blue_air = {FlightType.CAS: ["blue-cas"]}
+    game.pretense_air[PRETENSE_BLUE_SIDE]["zone"] = blue_air
+    game.pretense_ground_assault[PRETENSE_BLUE_SIDE]["zone"] = ["blue-assault"]
+    generator = PretenseLuaGenerator(game, Mission(), MissionData())
+
+    generator.init_pretense_zone("zone")
+
+    assert game.pretense_air[PRETENSE_RED_SIDE]["zone"] == {}
+    assert game.pretense_ground_supply[PRETENSE_RED_SIDE]["zone"] == []
+    assert game.pretense_ground_supply[PRETENSE_BLUE_SIDE]["zone"] == []
+    assert game.pretense_ground_assault[PRETENSE_RED_SIDE]["zone"] == []
+    # Groups that were already registered are kept.
+    assert game.pretense_air[PRETENSE_BLUE_SIDE]["zone"] is blue_air
+    assert game.pretense_ground_assault[PRETENSE_BLUE_SIDE]["zone"] == ["blue-assault"]
@@ -0,0 +1,21 @@
+import pytest
+
+from game.game import TurnState
+from qt_ui.windows.QLiberationWindow import END_GAME_MESSAGES
+
+
+@pytest.mark.parametrize(
+    "state,title,outcome",
+    [(TurnState.WIN, "Victory!", "won"), (TurnState.LOSS, "Defeat!", "lost")],
+)
+def test_end_game_message_reports_outcome(
+    state: TurnState, title: str, outcome: str
+) -> None:
+    assert END_GAME_MESSAGES[state] == (
+        title,
+        f"You have {outcome} the campaign, do you wish to start a new one?",
+    )
+
+
+def test_no_end_game_message_while_campaign_continues() -> None:
+    assert TurnState.CONTINUE not in END_GAME_MESSAGES
@@ -0,0 +1,57 @@
+import pytest
+from dcs import Point
+
+from game.theater.conflicttheater import ConflictTheater
+from game.theater.controlpoint import ControlPoint, Fob
+from game.theater.theaterloader import TheaterLoader
+
+
+@pytest.fixture(name="theater")
+def theater_fixture(monkeypatch: pytest.MonkeyPatch) -> ConflictTheater:
+    # The coalition of a control point is only set once a game is created, so take
+    # the owner from the starting side instead.
+    monkeypatch.setattr(Fob, "captured", property(lambda cp: cp.starts_blue))
+    return TheaterLoader("caucasus").load()
+
+
+def add_fob(
+    theater: ConflictTheater, name: str, x: float, y: float, starts_blue: bool
+) -> ControlPoint:
+    fob = Fob(name, Point(x, y, theater.terrain), theater, starts_blue)
+    theater.add_controlpoint(fob)
+    return fob
+
+
+def test_closest_friendly_control_points_matches_per_control_point(
+    theater: ConflictTheater,
+) -> None:
+    control_points = [
+        add_fob(theater, "a", 0, 0, True),
+        add_fob(theater, "b", 30, 0, True),
+        add_fob(theater, "c", 0, 10, True),
+        add_fob(theater, "d", 20, 25, True),
+        add_fob(theater, "e", 5, 5, False),
+        add_fob(theater, "f", 50, 50, False),
+    ]
+
+    closest = theater.closest_friendly_control_points()
+
+    assert set(closest) == set(control_points)
+    for cp in control_points:
+        assert closest[cp] == theater.closest_friendly_control_points_to(cp)
+
+
+def test_closest_friendly_control_points_keeps_ties(theater: ConflictTheater) -> None:
+    origin = add_fob(theater, "origin", 0, 0, True)
+    east = add_fob(theater, "east", 10, 0, True)
+    north = add_fob(theater, "north", 0, 10, True)
+    far = add_fob(theater, "far", 100, 0, True)
+    add_fob(theater, "enemy", 1, 1, False)
+
+    closest = theater.closest_friendly_control_points()
+
+    # Equidistant control points are all kept, in theater order.
+    assert closest[origin] == [east, north, far]
+    # closest_friendly_control_points_to keys by distance, so of the tied control
+    # points only the last one is kept.
+    assert theater.closest_friendly_control_points_to(origin) == [north, far]